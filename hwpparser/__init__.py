@@ -22,6 +22,9 @@ Examples:
 
     >>> # HWPX 생성
     >>> hwpparser.markdown_to_hwpx("# 제목\\n내용", "output.hwpx")
+
+    >>> # 비동기 서버에서
+    >>> text = await hwpparser.aconvert("document.hwp", output_format="text")
 """
 
 from __future__ import annotations
@@ -30,17 +33,13 @@ __version__ = "0.1.0"
 __author__ = "HariFatherKR"
 __license__ = "MIT"
 
-# 예외
+import importlib
+from typing import TYPE_CHECKING, Any
+
 # 로깅 설정
 from ._logging import setup_logging
 
-# Converter
-from .converter import (
-    convert,
-    get_supported_conversions,
-    get_supported_input_formats,
-    get_supported_output_formats,
-)
+# 예외 (가벼운 모듈이므로 즉시 임포트)
 from .exceptions import (
     ConversionError,
     DependencyError,
@@ -49,40 +48,103 @@ from .exceptions import (
     UnsupportedFormatError,
 )
 
-# Reader
-from .reader import (
-    HWPDocument,
-    HWPReader,
-    hwp_to_html,
-    hwp_to_odt,
-    hwp_to_pdf,
-    hwp_to_text,
-    read_hwp,
-)
+# 무거운 하위 모듈(lxml, subprocess 래퍼 등)은 처음 접근할 때 임포트 (PEP 562)
+_LAZY_ATTRS: dict[str, str] = {
+    # Converter
+    "convert": ".converter",
+    "get_supported_conversions": ".converter",
+    "get_supported_input_formats": ".converter",
+    "get_supported_output_formats": ".converter",
+    # Converter (async)
+    "aconvert": ".converter_async",
+    "ahwp_to_text": ".converter_async",
+    "ahwp_to_pdf": ".converter_async",
+    # Reader
+    "HWPDocument": ".reader",
+    "HWPReader": ".reader",
+    "hwp_to_html": ".reader",
+    "hwp_to_odt": ".reader",
+    "hwp_to_pdf": ".reader",
+    "hwp_batch_to_pdf": ".reader",
+    "hwp_to_text": ".reader",
+    "read_hwp": ".reader",
+    # Workflows
+    "BatchResult": ".workflows",
+    "DirectoryHWPLoader": ".workflows",
+    "Document": ".workflows",
+    "HWPLoader": ".workflows",
+    "TextChunk": ".workflows",
+    "batch_convert": ".workflows",
+    "batch_extract_text": ".workflows",
+    "chunk_text": ".workflows",
+    "export_to_jsonl": ".workflows",
+    "extract_metadata": ".workflows",
+    "hwp_batch_to_chunks": ".workflows",
+    "hwp_to_chunks": ".workflows",
+    # Writer
+    "BatchHWPXWriter": ".writer",
+    "HWPXWriter": ".writer",
+    "batch_write_hwpx": ".writer",
+    "html_to_hwpx": ".writer",
+    "markdown_to_hwpx": ".writer",
+    "write_hwpx": ".writer",
+}
 
-# Workflows
-from .workflows import (
-    # 청킹 (RAG용)
-    BatchResult,
-    DirectoryHWPLoader,
-    Document,
-    HWPLoader,
-    TextChunk,
-    batch_convert,
-    batch_extract_text,
-    chunk_text,
-    export_to_jsonl,
-    extract_metadata,
-    hwp_to_chunks,
-)
+if TYPE_CHECKING:
+    from .converter import (
+        convert,
+        get_supported_conversions,
+        get_supported_input_formats,
+        get_supported_output_formats,
+    )
+    from .converter_async import aconvert, ahwp_to_pdf, ahwp_to_text
+    from .reader import (
+        HWPDocument,
+        HWPReader,
+        hwp_batch_to_pdf,
+        hwp_to_html,
+        hwp_to_odt,
+        hwp_to_pdf,
+        hwp_to_text,
+        read_hwp,
+    )
+    from .workflows import (
+        BatchResult,
+        DirectoryHWPLoader,
+        Document,
+        HWPLoader,
+        TextChunk,
+        batch_convert,
+        batch_extract_text,
+        chunk_text,
+        export_to_jsonl,
+        extract_metadata,
+        hwp_batch_to_chunks,
+        hwp_to_chunks,
+    )
+    from .writer import (
+        BatchHWPXWriter,
+        HWPXWriter,
+        batch_write_hwpx,
+        html_to_hwpx,
+        markdown_to_hwpx,
+        write_hwpx,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    """지연 임포트 대상 속성을 처음 접근할 때 로드하고 모듈에 캐싱합니다."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
 
-# Writer
-from .writer import (
-    HWPXWriter,
-    html_to_hwpx,
-    markdown_to_hwpx,
-    write_hwpx,
-)
 
 # 하위 호환성
 FileNotFoundError = HWPFileNotFoundError  # noqa: A001
@@ -106,9 +168,12 @@ __all__ = [
     "hwp_to_html",
     "hwp_to_odt",
     "hwp_to_pdf",
+    "hwp_batch_to_pdf",
     # Writer
     "HWPXWriter",
+    "BatchHWPXWriter",
     "write_hwpx",
+    "batch_write_hwpx",
     "markdown_to_hwpx",
     "html_to_hwpx",
     # Converter
@@ -116,10 +181,15 @@ __all__ = [
     "get_supported_conversions",
     "get_supported_input_formats",
     "get_supported_output_formats",
+    # Converter (async)
+    "aconvert",
+    "ahwp_to_text",
+    "ahwp_to_pdf",
     # Workflows - 청킹 (RAG)
     "TextChunk",
     "chunk_text",
     "hwp_to_chunks",
+    "hwp_batch_to_chunks",
     # Workflows - 배치 처리
     "BatchResult",
     "batch_convert",
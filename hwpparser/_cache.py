@@ -0,0 +1,244 @@
+"""
+HWP Parser 변환 캐시
+
+입력 바이트 내용 기반(content-addressable) 변환 결과 캐시.
+동일한 입력을 다시 변환할 때 외부 CLI(hwp5txt, hwp5html, pypandoc-hwpx, Chrome)
+실행을 건너뜁니다.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from . import __version__
+from ._logging import get_logger
+from ._types import ConversionResult, PathLike
+from .constants import CACHE_READ_CHUNK_SIZE, DEFAULT_ENCODING
+from .utils import ensure_path
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = get_logger("cache")
+
+
+def _update_length_prefixed(hasher: hashlib._Hash, value: str) -> None:
+    """8바이트 길이 접두사를 붙여 문자열을 해시에 추가합니다.
+
+    경계가 모호한 연결(예: "ab"+"c"와 "a"+"bc")로 인한 충돌을 방지합니다.
+    """
+    data = value.encode(DEFAULT_ENCODING)
+    hasher.update(len(data).to_bytes(8, "big"))
+    hasher.update(data)
+
+
+def make_cache_key(input_path: PathLike, input_format: str, output_format: str) -> str:
+    """변환 캐시 키를 계산합니다.
+
+    키는 (입력 바이트 sha256, 입력 포맷, 출력 포맷, 변환기 버전)으로 구성됩니다.
+
+    Args:
+        input_path: 입력 파일 경로
+        input_format: 입력 포맷
+        output_format: 출력 포맷
+
+    Returns:
+        16진수 sha256 다이제스트
+    """
+    hasher = hashlib.sha256()
+    with open(input_path, "rb") as f:
+        while chunk := f.read(CACHE_READ_CHUNK_SIZE):
+            hasher.update(chunk)
+    _update_length_prefixed(hasher, input_format)
+    _update_length_prefixed(hasher, output_format)
+    _update_length_prefixed(hasher, __version__)
+    return hasher.hexdigest()
+
+
+class ConversionCache:
+    """디스크 기반 변환 결과 캐시.
+
+    텍스트 결과는 ``<key>.txt``, 파일 결과는 ``<key>.<ext>``로 저장하고,
+    감사 기록용 메타데이터를 ``<key>.json``에 함께 남깁니다.
+
+    Example:
+        >>> cache = ConversionCache(Path("~/.cache/hwpparser").expanduser())
+        >>> key = make_cache_key("document.hwp", "hwp", "text")
+        >>> if (hit := cache.get(key)) is None:
+        ...     cache.put(key, hwp_to_text("document.hwp"))
+    """
+
+    __slots__ = ("cache_dir",)
+
+    def __init__(self, cache_dir: PathLike) -> None:
+        """ConversionCache를 초기화합니다.
+
+        Args:
+            cache_dir: 캐시 디렉토리 (없으면 생성)
+        """
+        self.cache_dir = ensure_path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __repr__(self) -> str:
+        return f"ConversionCache(cache_dir={self.cache_dir!r})"
+
+    def _meta_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> ConversionResult | None:
+        """캐시된 결과를 반환합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            텍스트 결과는 str, 파일 결과는 캐시 내 파일 Path, 없으면 None
+        """
+        meta_path = self._meta_path(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding=DEFAULT_ENCODING))
+        except (OSError, ValueError):
+            return None
+
+        stored = self.cache_dir / meta.get("file", "")
+        if not stored.is_file():
+            return None
+
+        logger.debug("캐시 적중: %s", key)
+        if meta.get("kind") == "text":
+            return stored.read_text(encoding=DEFAULT_ENCODING)
+        return stored
+
+    def put(self, key: str, result: ConversionResult, *, provider: str = "") -> None:
+        """변환 결과를 캐시에 저장합니다.
+
+        Args:
+            key: 캐시 키
+            result: 텍스트(str) 또는 생성된 파일 경로(Path)
+            provider: 결과를 생성한 변환기 이름 (감사 기록용)
+        """
+        if isinstance(result, str):
+            kind = "text"
+            stored = self.cache_dir / f"{key}.txt"
+            with self._replacing(stored) as temp_path:
+                temp_path.write_text(result, encoding=DEFAULT_ENCODING)
+        else:
+            kind = "file"
+            stored = self.cache_dir / f"{key}{result.suffix}"
+            with self._replacing(stored) as temp_path:
+                shutil.copyfile(result, temp_path)
+
+        meta = {
+            "key": key,
+            "kind": kind,
+            "file": stored.name,
+            "provider": provider,
+            "converter_version": __version__,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        # 결과 파일을 먼저 교체한 뒤 메타데이터를 교체해야 get()이 불완전한 항목을 보지 않음
+        with self._replacing(self._meta_path(key)) as temp_path:
+            temp_path.write_text(json.dumps(meta), encoding=DEFAULT_ENCODING)
+        logger.debug("캐시 저장: %s (%s)", key, kind)
+
+    @contextlib.contextmanager
+    def _replacing(self, target: Path) -> Iterator[Path]:
+        """임시 파일에 쓰게 한 뒤 target으로 원자적으로 교체합니다.
+
+        여러 프로세스/스레드가 같은 키를 동시에 저장하거나 읽어도
+        get()이 쓰다 만 파일을 보지 않도록 cache_dir 안의 고유한 임시 이름을 씁니다.
+        """
+        temp_path = target.with_name(f"{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            yield temp_path
+            os.replace(temp_path, target)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+
+class TextManifest:
+    """파일 경로별 추출 텍스트를 한 파일에 보관하는 디스크 매니페스트.
+
+    항목은 (st_mtime_ns, st_size)와 함께 저장되며, 파일이 바뀌면 더 이상 적중하지
+    않습니다. batch_extract_text()와 export_to_jsonl()처럼 같은 폴더를 반복해서
+    처리하는 작업이 이전 실행의 hwp5txt 결과를 재사용할 때 씁니다.
+    pickle로 저장하므로 신뢰할 수 있는 경로만 지정해야 합니다.
+
+    Example:
+        >>> manifest = TextManifest.load(Path(".hwpparser-text.pickle"))
+        >>> stat = path.stat()
+        >>> if (text := manifest.get(path, stat)) is None:
+        ...     manifest.put(path, stat, text := hwp_to_text(path))
+        >>> manifest.save()
+    """
+
+    __slots__ = ("path", "_entries", "_dirty")
+
+    def __init__(self, path: PathLike, entries: dict[str, tuple[int, int, str]] | None = None) -> None:
+        """TextManifest를 초기화합니다 (디스크에서 읽으려면 load() 사용).
+
+        Args:
+            path: 매니페스트 파일 경로
+            entries: 경로 → (st_mtime_ns, st_size, 텍스트)
+        """
+        self.path = ensure_path(path)
+        self._entries = entries if entries is not None else {}
+        self._dirty = False
+
+    def __repr__(self) -> str:
+        return f"TextManifest(path={self.path!r}, entries={len(self._entries)})"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @classmethod
+    def load(cls, path: PathLike) -> TextManifest:
+        """매니페스트 파일을 읽습니다 (없거나 읽을 수 없으면 빈 매니페스트)."""
+        path = ensure_path(path)
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+        except FileNotFoundError:
+            return cls(path)
+        except Exception as e:
+            logger.warning("텍스트 매니페스트를 읽을 수 없어 새로 만듭니다: %s (%s)", path, e)
+            return cls(path)
+
+        # 다른 버전이 만든 매니페스트는 추출 결과가 다를 수 있으므로 버림
+        if not isinstance(data, dict) or data.get("version") != __version__:
+            return cls(path)
+        return cls(path, data.get("entries", {}))
+
+    def get(self, file_path: PathLike, stat_result: os.stat_result) -> str | None:
+        """파일이 저장 당시와 같으면 텍스트를, 아니면 None을 반환합니다."""
+        entry = self._entries.get(os.fspath(file_path))
+        if entry is None or entry[0] != stat_result.st_mtime_ns or entry[1] != stat_result.st_size:
+            return None
+        return entry[2]
+
+    def put(self, file_path: PathLike, stat_result: os.stat_result, text: str) -> None:
+        """파일의 추출 텍스트를 기록합니다 (save() 전까지는 메모리에만 있음)."""
+        self._entries[os.fspath(file_path)] = (stat_result.st_mtime_ns, stat_result.st_size, text)
+        self._dirty = True
+
+    def save(self) -> None:
+        """변경 사항이 있으면 매니페스트를 원자적으로 저장합니다."""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            pickle.dump({"version": __version__, "entries": self._entries}, f, protocol=5)
+        # 쓰는 도중 중단되어도 기존 매니페스트가 깨지지 않도록 교체
+        os.replace(temp_path, self.path)
+        self._dirty = False
+        logger.debug("텍스트 매니페스트 저장: %s (%d개)", self.path, len(self._entries))
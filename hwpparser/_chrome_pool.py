@@ -0,0 +1,317 @@
+"""
+HWP Parser Chrome 워커
+
+Chrome headless를 한 번만 실행하고 DevTools Protocol(CDP)로 여러 HTML을
+PDF로 인쇄합니다. 파일마다 Chrome을 새로 띄우는 1~2초의 시작 비용을
+배치 전체에 걸쳐 한 번으로 줄입니다.
+
+websocket-client 패키지가 필요합니다 (pip install hwpparser[pdf]).
+"""
+
+from __future__ import annotations
+
+import base64
+import contextlib
+import contextvars
+import json
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from ._logging import get_logger
+from .constants import CHROME_RENDER_TIMEOUT, CHROME_STARTUP_TIMEOUT, WEBSOCKET_CLIENT_INSTALL_HINT
+from .exceptions import ConversionError, DependencyError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+logger = get_logger("chrome")
+
+# 현재 컨텍스트에서 열려 있는 워커 (with 블록 동안 hwp_to_pdf가 자동으로 사용)
+# 컨텍스트 변수이므로 다른 스레드의 hwp_to_pdf 호출은 이 워커를 쓰지 않음
+_active_worker: contextvars.ContextVar[ChromeWorker | None] = contextvars.ContextVar(
+    "hwpparser_chrome_worker", default=None
+)
+
+
+def active_worker() -> ChromeWorker | None:
+    """현재 컨텍스트에서 with 블록으로 열려 있는 ChromeWorker를 반환합니다 (없으면 None)."""
+    return _active_worker.get()
+
+
+@contextlib.contextmanager
+def use_worker(worker: ChromeWorker | None) -> Iterator[None]:
+    """블록 안에서 hwp_to_pdf가 worker를 사용하게 합니다 (워커 스레드에 워커를 넘길 때 사용).
+
+    Args:
+        worker: 사용할 ChromeWorker (None이면 아무것도 바꾸지 않음)
+    """
+    if worker is None:
+        yield
+        return
+    token = _active_worker.set(worker)
+    try:
+        yield
+    finally:
+        _active_worker.reset(token)
+
+
+class ChromeWorker:
+    """장시간 실행되는 Chrome headless 인스턴스.
+
+    스레드 간에 공유할 수 있으며, 인쇄 요청은 내부 락으로 직렬화됩니다.
+
+    Example:
+        >>> with ChromeWorker(chrome_path) as chrome:
+        ...     chrome.render_html_to_pdf(Path("a/index.xhtml"), Path("a.pdf"))
+        ...     chrome.render_html_to_pdf(Path("b/index.xhtml"), Path("b.pdf"))
+    """
+
+    __slots__ = (
+        "chrome_path",
+        "_process",
+        "_profile_dir",
+        "_ws",
+        "_session_id",
+        "_next_id",
+        "_events",
+        "_lock",
+        "_deadline",
+        "_token",
+    )
+
+    def __init__(self, chrome_path: str) -> None:
+        """ChromeWorker를 초기화합니다 (Chrome은 start()에서 실행).
+
+        Args:
+            chrome_path: Chrome/Chromium 실행 파일 경로
+        """
+        self.chrome_path = chrome_path
+        self._process: subprocess.Popen[bytes] | None = None
+        self._profile_dir: Path | None = None
+        self._ws: Any = None
+        self._session_id = ""
+        self._next_id = 0
+        self._events: list[dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._deadline = 0.0
+        self._token: contextvars.Token[ChromeWorker | None] | None = None
+
+    def __enter__(self) -> ChromeWorker:
+        self.start()
+        if _active_worker.get() is None:
+            self._token = _active_worker.set(self)
+        return self
+
+    def __exit__(self, exc_type: type | None, exc_val: BaseException | None, exc_tb: Any) -> None:
+        if self._token is not None:
+            _active_worker.reset(self._token)
+            self._token = None
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ChromeWorker(chrome_path={self.chrome_path!r}, running={self._ws is not None})"
+
+    def start(self) -> None:
+        """Chrome을 실행하고 CDP 세션에 연결합니다.
+
+        Raises:
+            DependencyError: websocket-client가 설치되지 않은 경우
+            ConversionError: Chrome 실행 또는 CDP 연결 실패 시
+        """
+        try:
+            import websocket
+        except ImportError as e:
+            raise DependencyError("websocket-client", WEBSOCKET_CLIENT_INSTALL_HINT) from e
+
+        self._profile_dir = Path(tempfile.mkdtemp(prefix="hwpparser-chrome-"))
+        logger.info("Chrome 워커 시작: %s", self.chrome_path)
+        self._process = subprocess.Popen(
+            [
+                self.chrome_path,
+                "--headless=new",
+                "--disable-gpu",
+                "--no-sandbox",
+                "--remote-debugging-port=0",
+                f"--user-data-dir={self._profile_dir}",
+                "about:blank",
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+        try:
+            ws_url = self._wait_for_devtools_url()
+            self._deadline = time.monotonic() + CHROME_STARTUP_TIMEOUT
+            self._ws = websocket.create_connection(
+                ws_url,
+                timeout=CHROME_STARTUP_TIMEOUT,
+                suppress_origin=True,
+            )
+            target = self._call("Target.createTarget", {"url": "about:blank"})
+            attached = self._call(
+                "Target.attachToTarget",
+                {"targetId": target["targetId"], "flatten": True},
+            )
+            self._session_id = attached["sessionId"]
+            self._call("Page.enable", session=True)
+        except Exception as e:
+            self.close()
+            if isinstance(e, ConversionError):
+                raise
+            raise ConversionError(f"Chrome DevTools 연결 실패: {e}") from e
+
+        logger.debug("Chrome 워커 연결됨: %s", ws_url)
+
+    def _wait_for_devtools_url(self) -> str:
+        """Chrome이 DevToolsActivePort 파일을 기록할 때까지 기다립니다."""
+        assert self._profile_dir is not None and self._process is not None
+        port_file = self._profile_dir / "DevToolsActivePort"
+        deadline = time.monotonic() + CHROME_STARTUP_TIMEOUT
+
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise ConversionError(f"Chrome이 종료되었습니다 (코드 {self._process.returncode})")
+            try:
+                port, browser_path = port_file.read_text().split("\n")[:2]
+            except (OSError, ValueError):
+                time.sleep(0.05)
+                continue
+            if port and browser_path:
+                return f"ws://127.0.0.1:{port}{browser_path}"
+            time.sleep(0.05)
+
+        raise ConversionError(f"Chrome 시작 시간 초과 ({CHROME_STARTUP_TIMEOUT}초)")
+
+    def _recv(self) -> dict[str, Any]:
+        """현재 요청의 마감 시간 안에서 CDP 메시지 하나를 받습니다.
+
+        Raises:
+            TimeoutError: 마감 시간이 지난 경우 (Chrome이 응답하지 않음)
+        """
+        remaining = self._deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError("Chrome 응답 시간 초과")
+        # recv()마다 남은 시간만큼만 기다리므로 멈춘 Chrome이 락을 영원히 잡지 않음
+        self._ws.settimeout(remaining)
+        return json.loads(self._ws.recv())
+
+    def _call(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        session: bool = False,
+    ) -> dict[str, Any]:
+        """CDP 명령을 보내고 응답을 기다립니다. 도중에 받은 이벤트는 버퍼링합니다."""
+        self._next_id += 1
+        message: dict[str, Any] = {"id": self._next_id, "method": method, "params": params or {}}
+        if session:
+            message["sessionId"] = self._session_id
+        self._ws.send(json.dumps(message))
+
+        while True:
+            reply = self._recv()
+            if reply.get("id") == self._next_id:
+                if "error" in reply:
+                    raise ConversionError(f"CDP {method} 실패: {reply['error'].get('message')}")
+                return reply.get("result", {})
+            if "method" in reply:
+                self._events.append(reply)
+
+    def _wait_event(self, method: str) -> dict[str, Any]:
+        """현재 세션에서 지정한 CDP 이벤트가 도착할 때까지 기다립니다."""
+        while True:
+            for i, event in enumerate(self._events):
+                if event["method"] == method and event.get("sessionId") == self._session_id:
+                    del self._events[: i + 1]
+                    return event.get("params", {})
+            self._events.clear()
+            reply = self._recv()
+            if "method" in reply:
+                self._events.append(reply)
+
+    def render_html_to_pdf(
+        self,
+        html_file: Path,
+        output_path: Path,
+        *,
+        timeout: float = CHROME_RENDER_TIMEOUT,
+    ) -> Path:
+        """HTML 파일을 PDF로 인쇄합니다.
+
+        Args:
+            html_file: 입력 HTML 파일 (상대 경로 리소스는 이 파일 기준)
+            output_path: 출력 PDF 파일 경로
+            timeout: 로드와 인쇄를 합친 최대 대기 시간 (초)
+
+        Returns:
+            생성된 PDF 파일 경로
+
+        Raises:
+            ConversionError: 워커가 시작되지 않았거나 인쇄 실패 시
+                (연결이 끊기거나 시간이 초과되면 워커를 종료하므로 이후 호출도 ConversionError)
+        """
+        with self._lock:
+            if self._ws is None:
+                raise ConversionError("Chrome 워커가 시작되지 않았습니다.")
+            self._deadline = time.monotonic() + timeout
+            try:
+                self._events.clear()
+                navigated = self._call(
+                    "Page.navigate",
+                    {"url": html_file.resolve().as_uri()},
+                    session=True,
+                )
+                if navigated.get("errorText"):
+                    raise ConversionError(f"HTML 로드 실패: {html_file} ({navigated['errorText']})")
+                self._wait_event("Page.loadEventFired")
+                printed = self._call(
+                    "Page.printToPDF",
+                    {"printBackground": True, "displayHeaderFooter": False},
+                    session=True,
+                )
+            except ConversionError:
+                raise
+            except Exception as e:
+                # 연결 끊김/시간 초과로 세션 상태를 알 수 없으므로 워커를 종료
+                self.close()
+                raise ConversionError(f"Chrome 인쇄 실패: {html_file} ({e})") from e
+
+        output_path.write_bytes(base64.b64decode(printed["data"]))
+        logger.debug("PDF 인쇄 완료: %s", output_path)
+        return output_path
+
+    def close(self) -> None:
+        """CDP 연결을 닫고 Chrome을 종료합니다."""
+        if self._ws is not None:
+            # 응답하지 않는 Chrome이면 짧게 기다린 뒤 프로세스를 종료
+            self._deadline = time.monotonic() + CHROME_STARTUP_TIMEOUT
+            try:
+                self._call("Browser.close")
+            except Exception:
+                pass
+            try:
+                self._ws.close()
+            except Exception:
+                pass
+            self._ws = None
+
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+            self._process = None
+
+        if self._profile_dir is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
+        logger.debug("Chrome 워커 종료")
@@ -8,7 +8,7 @@ from __future__ import annotations
 
 import subprocess
 from pathlib import Path
-from typing import TYPE_CHECKING, Protocol, TypeAlias, Union, runtime_checkable
+from typing import TYPE_CHECKING, Any, Protocol, TypeAlias, Union, runtime_checkable
 
 if TYPE_CHECKING:
     from os import PathLike as OSPathLike
@@ -61,6 +61,8 @@ class CommandRunner(Protocol):
     """외부 명령어 실행기 프로토콜.
 
     테스트 시 모킹을 위해 사용합니다.
+    출력은 기본적으로 bytes로 받고 호출자가 한 번에 디코딩합니다
+    (텍스트 모드의 점진적 디코딩보다 큰 출력에서 빠름).
     """
 
     def run(
@@ -69,7 +71,7 @@ class CommandRunner(Protocol):
         *,
         check: bool = True,
         capture_output: bool = True,
-        text: bool = True,
-    ) -> subprocess.CompletedProcess[str]:
+        text: bool = False,
+    ) -> subprocess.CompletedProcess[Any]:
         """명령어를 실행합니다."""
         ...
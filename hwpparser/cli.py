@@ -5,29 +5,39 @@ HWP Parser CLI
     hwpparser convert input.hwp output.txt
     hwpparser convert input.hwp output.pdf
     hwpparser convert input.md output.hwpx
+    hwpparser convert "docs/*.hwp" out/ -t pdf -j 4
     hwpparser text input.hwp
+    hwpparser text "docs/**/*.hwp" -o out/
     hwpparser formats
 """
 
 from __future__ import annotations
 
 import argparse
+import glob
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
 
 from . import __version__
 from ._logging import get_logger, setup_logging
 from .constants import DEFAULT_ENCODING
-from .converter import convert, get_supported_conversions
 from .exceptions import ConversionError, DependencyError, HWPFileNotFoundError, HWPParserError
-from .reader import hwp_to_text, hwp_to_rich_text
+from .utils import default_max_workers
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
 logger = get_logger("cli")
 
+_T = TypeVar("_T")
+
+# 입력 경로에 이 문자가 있으면 glob 패턴으로 확장
+_GLOB_CHARS = frozenset("*?[")
+
+# main()이 같은 프로세스에서 반복 호출될 때 재사용하는 파서
+_parser: argparse.ArgumentParser | None = None
+
 
 def create_parser() -> argparse.ArgumentParser:
     """CLI 파서를 생성합니다."""
@@ -53,8 +63,8 @@ def create_parser() -> argparse.ArgumentParser:
         "convert",
         help="문서 포맷 변환",
     )
-    convert_parser.add_argument("input", help="입력 파일 경로")
-    convert_parser.add_argument("output", help="출력 파일 경로")
+    convert_parser.add_argument("input", help="입력 파일 경로 (glob 패턴 가능)")
+    convert_parser.add_argument("output", help="출력 파일 경로 (여러 파일이면 출력 폴더)")
     convert_parser.add_argument(
         "-f", "--from",
         dest="input_format",
@@ -63,19 +73,21 @@ def create_parser() -> argparse.ArgumentParser:
     convert_parser.add_argument(
         "-t", "--to",
         dest="output_format",
-        help="출력 포맷 (자동 감지됨)",
+        help="출력 포맷 (자동 감지됨, 여러 파일 변환 시 필수)",
     )
+    _add_jobs_argument(convert_parser)
 
     # text 명령어 (HWP → 텍스트 단축)
     text_parser = subparsers.add_parser(
         "text",
         help="HWP에서 텍스트 추출 (표는 <표>로 표시됨)",
     )
-    text_parser.add_argument("input", help="HWP 파일 경로")
+    text_parser.add_argument("input", help="HWP 파일 경로 (glob 패턴 가능)")
     text_parser.add_argument(
         "-o", "--output",
-        help="출력 파일 (미지정 시 stdout)",
+        help="출력 파일 (미지정 시 stdout, 여러 파일이면 출력 폴더)",
     )
+    _add_jobs_argument(text_parser)
 
     # rich-text 명령어 (표 포함 텍스트 추출)
     rich_text_parser = subparsers.add_parser(
@@ -97,10 +109,163 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def _add_jobs_argument(parser: argparse.ArgumentParser) -> None:
+    """병렬 작업 수 옵션을 추가합니다."""
+    parser.add_argument(
+        "-j", "--jobs",
+        type=int,
+        default=None,
+        help="여러 파일 처리 시 병렬 작업 수 (기본값: HWPPARSER_BATCH_WORKERS 또는 CPU 수 - 1)",
+    )
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """CLI 파서를 한 번만 생성하고 재사용합니다."""
+    global _parser
+    if _parser is None:
+        _parser = create_parser()
+    return _parser
+
+
+def _expand_inputs(pattern: str) -> list[str]:
+    """glob 패턴이면 일치하는 파일 목록으로 확장합니다.
+
+    Raises:
+        HWPFileNotFoundError: 패턴과 일치하는 파일이 없을 경우
+    """
+    if not _GLOB_CHARS.intersection(pattern):
+        return [pattern]
+    matches = sorted(glob.glob(pattern, recursive=True))
+    if not matches:
+        raise HWPFileNotFoundError(pattern)
+    return matches
+
+
+def _glob_base(pattern: str) -> Path:
+    """glob 패턴에서 와일드카드가 처음 나오기 전까지의 디렉토리를 반환합니다."""
+    base: list[str] = []
+    for part in Path(pattern).parent.parts:
+        if _GLOB_CHARS.intersection(part):
+            break
+        base.append(part)
+    return Path(*base) if base else Path()
+
+
+def _output_paths(pattern: str, inputs: Sequence[str], output_dir: Path, suffix: str) -> list[Path]:
+    """여러 입력 파일의 출력 경로를 계산합니다 (glob 기준 폴더에 대한 상대 경로 유지).
+
+    "**/*.hwp"처럼 여러 폴더에서 같은 이름의 파일이 나와도 덮어쓰지 않도록
+    하위 폴더 구조를 출력 폴더 아래에 그대로 만듭니다.
+
+    Raises:
+        HWPParserError: 서로 다른 입력이 같은 출력 경로가 되는 경우
+    """
+    base = _glob_base(pattern)
+    outputs: list[Path] = []
+    seen: dict[Path, str] = {}
+    for input_path in inputs:
+        try:
+            relative = Path(input_path).relative_to(base)
+        except ValueError:
+            relative = Path(Path(input_path).name)
+        output_path = output_dir / relative.with_suffix(suffix)
+        if output_path in seen:
+            raise HWPParserError(
+                f"출력 경로가 겹칩니다: {seen[output_path]}, {input_path} → {output_path}"
+            )
+        seen[output_path] = input_path
+        outputs.append(output_path)
+    for parent in {output_path.parent for output_path in outputs}:
+        parent.mkdir(parents=True, exist_ok=True)
+    return outputs
+
+
+def _run_parallel(func: Callable[..., _T], jobs: int | None, *iterables: Sequence[Any]) -> list[_T]:
+    """파일별 작업을 프로세스 풀로 실행합니다 (순서 유지).
+
+    작업이 하나뿐이거나 jobs가 1이면 풀 생성 비용을 피해 순차 실행합니다.
+    """
+    if jobs is None:
+        jobs = default_max_workers()
+    count = len(iterables[0])
+    if jobs <= 1 or count <= 1:
+        return list(map(func, *iterables))
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=min(jobs, count)) as pool:
+        return list(pool.map(func, *iterables, chunksize=4))
+
+
+def _convert_one(
+    input_path: str,
+    output_path: Path,
+    input_format: str | None,
+    output_format: str | None,
+) -> str | None:
+    """단일 파일 변환 (워커 프로세스용). 실패 시 오류 메시지를 반환합니다."""
+    from .converter import convert
+
+    try:
+        result = convert(
+            input_path,
+            output_path,
+            input_format=input_format,
+            output_format=output_format,
+        )
+        if isinstance(result, str):
+            output_path.write_text(result, encoding=DEFAULT_ENCODING)
+    except Exception as e:
+        # 파일 하나의 실패(OSError 등 포함)가 배치 전체를 중단시키지 않도록 메시지로 반환
+        return str(e)
+    return None
+
+
+def _text_one(input_path: str) -> tuple[str | None, str | None]:
+    """단일 파일 텍스트 추출 (워커 프로세스용). (텍스트, 오류 메시지)를 반환합니다."""
+    from .reader import hwp_to_text
+
+    try:
+        return hwp_to_text(input_path), None
+    except Exception as e:
+        return None, str(e)
+
+
+def _report_failures(inputs: Sequence[str], errors: Sequence[str | None]) -> int:
+    """실패한 파일을 stderr에 출력하고 종료 코드를 반환합니다."""
+    failed = 0
+    for input_path, error in zip(inputs, errors):
+        if error is not None:
+            failed += 1
+            print(f"오류: {input_path}: {error}", file=sys.stderr)
+    return 1 if failed else 0
+
+
 def cmd_convert(args: argparse.Namespace) -> int:
     """convert 명령어 실행."""
+    from .converter import convert
+
+    inputs = _expand_inputs(args.input)
+
+    if len(inputs) > 1:
+        if not args.output_format:
+            print("오류: 여러 파일 변환 시 -t/--to로 출력 포맷을 지정해야 합니다.", file=sys.stderr)
+            return 1
+        outputs = _output_paths(args.input, inputs, Path(args.output), f".{args.output_format}")
+        errors = _run_parallel(
+            _convert_one,
+            args.jobs,
+            inputs,
+            outputs,
+            [args.input_format] * len(inputs),
+            [args.output_format] * len(inputs),
+        )
+        for output_path, error in zip(outputs, errors):
+            if error is None:
+                print(f"생성됨: {output_path}", file=sys.stderr)
+        return _report_failures(inputs, errors)
+
     result = convert(
-        args.input,
+        inputs[0],
         args.output,
         input_format=args.input_format,
         output_format=args.output_format,
@@ -116,19 +281,46 @@ def cmd_convert(args: argparse.Namespace) -> int:
 
 def cmd_text(args: argparse.Namespace) -> int:
     """text 명령어 실행."""
-    text = hwp_to_text(args.input)
-
+    from .reader import stream_hwp_to_text
+
+    inputs = _expand_inputs(args.input)
+
+    if len(inputs) > 1:
+        outputs = _output_paths(args.input, inputs, Path(args.output), ".txt") if args.output else None
+        results = _run_parallel(_text_one, args.jobs, inputs)
+        errors: list[str | None] = []
+        for index, (input_path, (text, error)) in enumerate(zip(inputs, results)):
+            if text is not None:
+                if outputs is not None:
+                    try:
+                        outputs[index].write_text(text, encoding=DEFAULT_ENCODING)
+                    except OSError as e:
+                        error = str(e)
+                    else:
+                        print(f"생성됨: {outputs[index]}", file=sys.stderr)
+                else:
+                    print(f"# {input_path}\n")
+                    print(text)
+            errors.append(error)
+        return _report_failures(inputs, errors)
+
+    # 단일 파일은 텍스트 전체를 메모리에 올리지 않고 바로 내보냄
     if args.output:
-        Path(args.output).write_text(text, encoding=DEFAULT_ENCODING)
+        with open(args.output, "wb") as f:
+            stream_hwp_to_text(inputs[0], f)
         print(f"생성됨: {args.output}", file=sys.stderr)
     else:
-        print(text)
+        sys.stdout.flush()
+        stream_hwp_to_text(inputs[0], sys.stdout.buffer)
+        sys.stdout.buffer.flush()
 
     return 0
 
 
 def cmd_rich_text(args: argparse.Namespace) -> int:
     """rich-text 명령어 실행."""
+    from .reader import hwp_to_rich_text
+
     text = hwp_to_rich_text(args.input)
 
     if args.output:
@@ -142,6 +334,8 @@ def cmd_rich_text(args: argparse.Namespace) -> int:
 
 def cmd_formats(args: argparse.Namespace) -> int:
     """formats 명령어 실행."""
+    from .converter import get_supported_conversions
+
     del args  # unused
     print("지원 변환:")
     for inp, out in sorted(get_supported_conversions()):
@@ -149,6 +343,15 @@ def cmd_formats(args: argparse.Namespace) -> int:
     return 0
 
 
+# 명령어 → 핸들러 매핑
+_HANDLERS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "convert": cmd_convert,
+    "text": cmd_text,
+    "rich-text": cmd_rich_text,
+    "formats": cmd_formats,
+}
+
+
 def main(argv: Sequence[str] | None = None) -> int:
     """CLI 진입점.
 
@@ -158,7 +361,7 @@ def main(argv: Sequence[str] | None = None) -> int:
     Returns:
         종료 코드 (0: 성공, 1: 오류)
     """
-    parser = create_parser()
+    parser = _get_parser()
     args = parser.parse_args(argv)
 
     # 로깅 설정
@@ -170,16 +373,8 @@ def main(argv: Sequence[str] | None = None) -> int:
         parser.print_help()
         return 1
 
-    # 명령어 → 핸들러 매핑
-    handlers = {
-        "convert": cmd_convert,
-        "text": cmd_text,
-        "rich-text": cmd_rich_text,
-        "formats": cmd_formats,
-    }
-
     try:
-        handler = handlers.get(args.command)
+        handler = _HANDLERS.get(args.command)
         if handler is None:
             logger.error("알 수 없는 명령어: %s", args.command)
             return 1
@@ -6,8 +6,10 @@ HWP Parser 상수 정의
 
 from __future__ import annotations
 
+import sys
 from enum import StrEnum
-from typing import Final
+from types import MappingProxyType
+from typing import Final, Mapping
 
 
 class InputFormat(StrEnum):
@@ -36,23 +38,64 @@ PYHWP_INSTALL_HINT: Final[str] = "pip install pyhwp"
 PYPANDOC_INSTALL_HINT: Final[str] = "pip install pypandoc-hwpx"
 PANDOC_INSTALL_HINT: Final[str] = "brew install pandoc"
 CHROME_INSTALL_HINT: Final[str] = "brew install --cask google-chrome"
+WEBSOCKET_CLIENT_INSTALL_HINT: Final[str] = "pip install hwpparser[pdf]"
+WEASYPRINT_INSTALL_HINT: Final[str] = "pip install hwpparser[weasyprint]"
 # DEPRECATED: LibreOffice는 더 이상 사용하지 않음 (Chrome headless로 대체)
 # LIBREOFFICE_INSTALL_HINT: Final[str] = "brew install --cask libreoffice"
 
 # Chrome 경로 (macOS)
-CHROME_PATHS: Final[list[str]] = [
+CHROME_PATHS: Final[tuple[str, ...]] = (
     "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
     "/Applications/Chromium.app/Contents/MacOS/Chromium",
     "/opt/homebrew/bin/chromium",
     "/usr/bin/google-chrome",
     "/usr/bin/chromium-browser",
-]
+)
+
+# CHROME_PATHS에 없을 때 PATH에서 찾을 Chrome 명령어
+CHROME_COMMANDS: Final[tuple[str, ...]] = (
+    "google-chrome",
+    "chromium",
+    "chromium-browser",
+)
+
+# Chrome 워커(DevTools) 시작 대기 시간 (초)
+CHROME_STARTUP_TIMEOUT: Final[float] = 10.0
+
+# Chrome 워커 한 건의 인쇄(로드 + printToPDF) 대기 시간 (초)
+CHROME_RENDER_TIMEOUT: Final[float] = 120.0
+
+
+class PdfBackend(StrEnum):
+    """HTML → PDF 렌더링 백엔드."""
+
+    CHROME = "chrome"  # Chrome headless (ChromeWorker 재사용 가능)
+    WEASYPRINT = "weasyprint"  # 프로세스 내 렌더링 (Chrome 실행 없음)
+
 
 # 기본 인코딩
 DEFAULT_ENCODING: Final[str] = "utf-8"
 
-# 확장자 → 포맷 매핑
-EXTENSION_TO_FORMAT: Final[dict[str, str]] = {
+# 외부 명령어 출력 스트리밍 시 한 번에 읽는 크기 (64 KiB)
+STREAM_CHUNK_SIZE: Final[int] = 64 * 1024
+
+# JSONL 내보내기 쓰기 버퍼 크기 (1 MiB)
+JSONL_WRITE_BUFFER_SIZE: Final[int] = 1024 * 1024
+
+# 워크플로우에서 재사용할 추출 텍스트 수 (경로·수정 시간 기준 LRU)
+TEXT_CACHE_SIZE: Final[int] = 8
+
+# 변환 캐시 디렉토리 환경 변수 (설정 시 캐시 활성화)
+CACHE_DIR_ENV: Final[str] = "HWPPARSER_CACHE_DIR"
+
+# 캐시 키 계산 시 입력 파일 읽기 단위 (1 MiB)
+CACHE_READ_CHUNK_SIZE: Final[int] = 1024 * 1024
+
+# 배치 처리 워커 수 환경 변수 (미설정 시 CPU 수 - 1)
+BATCH_WORKERS_ENV: Final[str] = "HWPPARSER_BATCH_WORKERS"
+
+# 확장자 → 포맷 매핑 (읽기 전용)
+EXTENSION_TO_FORMAT: Final[Mapping[str, str]] = MappingProxyType({
     ".hwp": "hwp",
     ".hwpx": "hwpx",
     ".md": "markdown",
@@ -63,7 +106,18 @@ EXTENSION_TO_FORMAT: Final[dict[str, str]] = {
     ".txt": "text",
     ".odt": "odt",
     ".pdf": "pdf",
-}
+})
+
+# 포맷 문자열 → 열거형 멤버 (html처럼 양쪽에 있으면 입력 포맷 멤버)
+FORMAT_MEMBERS: Final[Mapping[str, InputFormat | OutputFormat]] = MappingProxyType({
+    **{fmt.value: fmt for fmt in OutputFormat},
+    **{fmt.value: fmt for fmt in InputFormat},
+})
+
+# 확장자 → 포맷 열거형 멤버 (키는 intern하여 조회 시 포인터 비교로 끝나도록)
+EXTENSION_TO_FORMAT_MEMBER: Final[Mapping[str, InputFormat | OutputFormat]] = MappingProxyType({
+    sys.intern(ext): FORMAT_MEMBERS[fmt] for ext, fmt in EXTENSION_TO_FORMAT.items()
+})
 
 # CLI 명령어
 class Command(StrEnum):
@@ -8,16 +8,28 @@ Converter - HWP/HWPX 문서 통합 변환 인터페이스
 
 from __future__ import annotations
 
+import logging
+import os
+import shutil
+import sys
 from pathlib import Path
+from types import MappingProxyType
 from typing import Callable
 
+from ._cache import ConversionCache, make_cache_key
 from ._logging import get_logger
 from ._types import PathLike
-from .constants import DEFAULT_ENCODING
+from .constants import (
+    CACHE_DIR_ENV,
+    DEFAULT_ENCODING,
+    FORMAT_MEMBERS,
+    InputFormat,
+    OutputFormat,
+)
 from .exceptions import UnsupportedFormatError
-from .reader import hwp_to_html, hwp_to_odt, hwp_to_pdf, hwp_to_text
-from .utils import ensure_path, get_format_from_extension, validate_file_exists
-from .writer import write_hwpx
+from .reader import hwp_to_html_to_file, hwp_to_odt, hwp_to_pdf, hwp_to_text
+from .utils import ensure_path, get_format_from_extension, validate_file_exists_str
+from .writer import file_to_hwpx, write_hwpx
 
 logger = get_logger("converter")
 
@@ -27,35 +39,110 @@ ConverterFunc = Callable[[PathLike, PathLike | None], str | Path]
 
 def _hwp_to_html_file(input_path: PathLike, output_path: PathLike | None) -> Path:
     """HWP → HTML 파일로 저장."""
-    html_content = hwp_to_html(input_path)
     if output_path is None:
         raise ValueError("HTML 파일 출력에는 output_path가 필요합니다.")
-    output = ensure_path(output_path)
-    output.write_text(html_content, encoding=DEFAULT_ENCODING)
-    return output
+    return hwp_to_html_to_file(input_path, output_path)
 
 
 def _file_to_hwpx(input_path: PathLike, output_path: PathLike | None, format_type: str) -> Path:
     """파일 → HWPX 변환."""
     if output_path is None:
         raise ValueError("HWPX 출력에는 output_path가 필요합니다.")
-    content = Path(input_path).read_text(encoding=DEFAULT_ENCODING)
+    # 확장자로 포맷이 맞게 추론되면 파일을 그대로 전달 (읽기/디코딩/임시 복사 없음)
+    if get_format_from_extension(input_path) == format_type:
+        return file_to_hwpx(input_path, output_path)
+    # 확장자와 다른 포맷을 지정한 경우: 디코딩 없이 bytes로 임시 파일에 전달
+    with open(input_path, "rb") as f:
+        content = f.read()
     return write_hwpx(content, output_path, format_type)
 
 
-# 지원하는 변환 조합: (입력 포맷, 출력 포맷) → 변환 함수
-SUPPORTED_CONVERSIONS: dict[tuple[str, str], ConverterFunc] = {
+def _hwp_to_text_adapter(input_path: PathLike, output_path: PathLike | None) -> str:
+    """HWP → 텍스트 (output_path 무시)."""
+    del output_path  # unused
+    return hwp_to_text(input_path)
+
+
+def _hwp_to_odt_adapter(input_path: PathLike, output_path: PathLike | None) -> Path:
+    """HWP → ODT 파일."""
+    if output_path is None:
+        raise ValueError("ODT 출력에는 output_path가 필요합니다.")
+    return hwp_to_odt(input_path, output_path)
+
+
+def _hwp_to_pdf_adapter(input_path: PathLike, output_path: PathLike | None) -> Path:
+    """HWP → PDF 파일."""
+    if output_path is None:
+        raise ValueError("PDF 출력에는 output_path가 필요합니다.")
+    return hwp_to_pdf(input_path, output_path)
+
+
+def _markdown_to_hwpx_adapter(input_path: PathLike, output_path: PathLike | None) -> Path:
+    """마크다운 파일 → HWPX."""
+    return _file_to_hwpx(input_path, output_path, "markdown")
+
+
+def _html_to_hwpx_adapter(input_path: PathLike, output_path: PathLike | None) -> Path:
+    """HTML 파일 → HWPX."""
+    return _file_to_hwpx(input_path, output_path, "html")
+
+
+def _identity_copy(input_path: str, output_path: PathLike | None) -> str | Path:
+    """같은 포맷 간 '변환' - 변환기를 실행하지 않습니다.
+
+    텍스트 출력이면 내용을 그대로 반환하고, 파일 출력이면 하드링크를 만듭니다
+    (다른 파일시스템 등 링크가 불가능하면 복사). 하드링크는 원본과 내용을 공유하므로
+    결과 파일을 제자리에서 수정하면 원본도 바뀝니다.
+    """
+    if output_path is None:
+        with open(input_path, encoding=DEFAULT_ENCODING) as f:
+            return f.read()
+
+    output = ensure_path(output_path)
+    if output.exists() and os.path.samefile(input_path, output):
+        return output
+    try:
+        os.link(input_path, output)
+    except OSError:
+        shutil.copyfile(input_path, output)
+    return output
+
+
+# 같은 포맷 간 변환을 링크/복사로 처리할 포맷
+_IDENTITY_FORMATS: frozenset[str] = frozenset(
+    fmt.value for fmt in (*InputFormat, *OutputFormat)
+)
+
+# 파일 대신 텍스트를 반환하는 출력 포맷
+_TEXT_OUTPUT_FORMATS: frozenset[str] = frozenset({OutputFormat.TEXT, OutputFormat.TXT})
+
+
+def _normalize_format(format_name: str) -> str:
+    """포맷 이름을 소문자로 바꾸고 이후 비교가 동일 객체 비교로 끝나도록 정규화합니다."""
+    lowered = format_name.lower()
+    member = FORMAT_MEMBERS.get(lowered)
+    return member if member is not None else sys.intern(lowered)
+
+
+# 지원하는 변환 조합: (입력 포맷, 출력 포맷) → 변환 함수 (읽기 전용)
+SUPPORTED_CONVERSIONS: MappingProxyType[tuple[str, str], ConverterFunc] = MappingProxyType({
     # HWP → 다른 포맷
-    ("hwp", "text"): lambda p, _: hwp_to_text(p),
-    ("hwp", "txt"): lambda p, _: hwp_to_text(p),
+    ("hwp", "text"): _hwp_to_text_adapter,
+    ("hwp", "txt"): _hwp_to_text_adapter,
     ("hwp", "html"): _hwp_to_html_file,
-    ("hwp", "odt"): lambda p, o: hwp_to_odt(p, o) if o else Path(),
-    ("hwp", "pdf"): lambda p, o: hwp_to_pdf(p, o) if o else Path(),
+    ("hwp", "odt"): _hwp_to_odt_adapter,
+    ("hwp", "pdf"): _hwp_to_pdf_adapter,
     # 다른 포맷 → HWPX
-    ("markdown", "hwpx"): lambda p, o: _file_to_hwpx(p, o, "markdown"),
-    ("md", "hwpx"): lambda p, o: _file_to_hwpx(p, o, "markdown"),
-    ("html", "hwpx"): lambda p, o: _file_to_hwpx(p, o, "html"),
-}
+    ("markdown", "hwpx"): _markdown_to_hwpx_adapter,
+    ("md", "hwpx"): _markdown_to_hwpx_adapter,
+    ("html", "hwpx"): _html_to_hwpx_adapter,
+})
+
+# 조회용 목록은 임포트 시 한 번만 계산
+_SUPPORTED_PAIRS: tuple[tuple[str, str], ...] = tuple(SUPPORTED_CONVERSIONS)
+_SUPPORTED_INPUTS: tuple[str, ...] = tuple(sorted({i for i, _ in _SUPPORTED_PAIRS}))
+_SUPPORTED_OUTPUTS: tuple[str, ...] = tuple(sorted({o for _, o in _SUPPORTED_PAIRS}))
+_SUPPORTED_DISPLAY: tuple[str, ...] = tuple(f"{i}→{o}" for i, o in _SUPPORTED_PAIRS)
 
 
 def convert(
@@ -64,6 +151,7 @@ def convert(
     *,
     input_format: str | None = None,
     output_format: str | None = None,
+    cache_dir: PathLike | None = None,
 ) -> str | Path:
     """문서를 다른 포맷으로 변환합니다.
 
@@ -72,6 +160,8 @@ def convert(
         output_path: 출력 파일 경로 (텍스트 출력 시 선택)
         input_format: 입력 포맷 (None이면 확장자에서 자동 감지)
         output_format: 출력 포맷 (None이면 출력 확장자에서 자동 감지)
+        cache_dir: 변환 캐시 디렉토리 (None이면 HWPPARSER_CACHE_DIR 환경 변수,
+            둘 다 없으면 캐시 사용 안 함)
 
     Returns:
         텍스트 출력 시 str, 파일 출력 시 Path
@@ -90,8 +180,12 @@ def convert(
 
         >>> # 마크다운 → HWPX
         >>> convert("document.md", "output.hwpx")
+
+        >>> # 동일 입력 재변환 시 캐시 사용
+        >>> convert("document.hwp", "output.pdf", cache_dir=".hwpparser-cache")
     """
-    input_path = validate_file_exists(input_path)
+    # 경로는 한 번만 문자열로 정규화하여 변환 함수와 subprocess에 그대로 전달
+    input_path = validate_file_exists_str(input_path)
 
     # 포맷 자동 감지
     if input_format is None:
@@ -103,47 +197,78 @@ def convert(
     if output_format is None:
         raise ValueError("output_format을 지정하거나 출력 파일 경로를 제공해야 합니다.")
 
-    # 정규화
-    input_format = input_format.lower()
-    output_format = output_format.lower()
+    # 정규화 (알려진 포맷은 열거형 멤버, 그 외는 intern된 문자열로 통일)
+    input_format = _normalize_format(input_format)
+    output_format = _normalize_format(output_format)
 
     logger.info("변환 시작: %s (%s) → %s", input_path, input_format, output_format)
 
+    is_text_output = output_format in _TEXT_OUTPUT_FORMATS
+
+    # 같은 포맷: 변환 없이 텍스트 반환 또는 링크/복사
+    if input_format == output_format and input_format in _IDENTITY_FORMATS:
+        if not is_text_output and output_path is None:
+            raise ValueError(f"{output_format} 출력에는 output_path가 필요합니다.")
+        result = _identity_copy(input_path, None if is_text_output else output_path)
+        logger.info("같은 포맷, 변환 생략: %s", input_path)
+        return result
+
     # 변환 함수 찾기
     conversion_key = (input_format, output_format)
     converter_func = SUPPORTED_CONVERSIONS.get(conversion_key)
 
     if converter_func is None:
-        supported = [f"{i}→{o}" for i, o in SUPPORTED_CONVERSIONS]
         raise UnsupportedFormatError(
             f"{input_format}→{output_format}",
-            supported,
+            _SUPPORTED_DISPLAY,
         )
 
-    # 텍스트 출력 (파일 불필요)
-    if output_format in ("text", "txt"):
-        result = converter_func(input_path, None)
-        logger.info("텍스트 추출 완료: %d 문자", len(str(result)))
-        return result
-
-    if output_path is None:
+    if not is_text_output and output_path is None:
         raise ValueError(f"{output_format} 출력에는 output_path가 필요합니다.")
 
-    result = converter_func(input_path, output_path)
-    logger.info("변환 완료: %s", result)
+    # 캐시 조회
+    if cache_dir is None:
+        cache_dir = os.environ.get(CACHE_DIR_ENV) or None
+    cache: ConversionCache | None = None
+    cache_key = ""
+    if cache_dir is not None:
+        cache = ConversionCache(cache_dir)
+        cache_key = make_cache_key(input_path, input_format, output_format)
+        cached = cache.get(cache_key)
+        if isinstance(cached, str):
+            logger.info("캐시에서 텍스트 반환: %s", input_path)
+            return cached
+        if cached is not None and output_path is not None:
+            output = ensure_path(output_path)
+            shutil.copyfile(cached, output)
+            logger.info("캐시에서 복사: %s", output)
+            return output
+
+    # 텍스트 출력 (파일 불필요)
+    if is_text_output:
+        result = converter_func(input_path, None)
+        # 로깅이 꺼져 있으면 길이 계산 생략
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("텍스트 추출 완료: %d 문자", len(result))
+    else:
+        result = converter_func(input_path, output_path)
+        logger.info("변환 완료: %s", result)
+
+    if cache is not None:
+        cache.put(cache_key, result, provider=f"{input_format}→{output_format}")
     return result
 
 
 def get_supported_conversions() -> list[tuple[str, str]]:
     """지원하는 (입력 포맷, 출력 포맷) 쌍 목록을 반환합니다."""
-    return list(SUPPORTED_CONVERSIONS.keys())
+    return list(_SUPPORTED_PAIRS)
 
 
 def get_supported_input_formats() -> list[str]:
     """지원하는 입력 포맷 목록을 반환합니다."""
-    return sorted({fmt for fmt, _ in SUPPORTED_CONVERSIONS})
+    return list(_SUPPORTED_INPUTS)
 
 
 def get_supported_output_formats() -> list[str]:
     """지원하는 출력 포맷 목록을 반환합니다."""
-    return sorted({fmt for _, fmt in SUPPORTED_CONVERSIONS})
+    return list(_SUPPORTED_OUTPUTS)
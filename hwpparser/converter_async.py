@@ -0,0 +1,75 @@
+"""
+Converter (async) - 이벤트 루프를 막지 않는 비동기 변환 인터페이스
+
+hwp5txt, hwp5html, Chrome headless 등 변환 함수는 외부 프로세스를 실행하고
+완료될 때까지 수 초간 블로킹합니다. 이 모듈의 함수들은 동기 함수를
+``asyncio.to_thread()``로 워커 스레드에서 실행하므로 FastAPI 등 비동기 서버에서
+안전하게 호출할 수 있습니다.
+
+Examples:
+    >>> text = await aconvert("document.hwp", output_format="text")
+    >>> await ahwp_to_pdf("document.hwp", "output.pdf")
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from ._types import PathLike
+from .constants import PdfBackend
+from .converter import convert
+from .reader import hwp_to_pdf, hwp_to_text
+
+if TYPE_CHECKING:
+    from ._chrome_pool import ChromeWorker
+
+
+async def aconvert(
+    input_path: PathLike,
+    output_path: PathLike | None = None,
+    *,
+    input_format: str | None = None,
+    output_format: str | None = None,
+    cache_dir: PathLike | None = None,
+) -> str | Path:
+    """convert()의 비동기 버전.
+
+    인자와 반환값, 예외는 convert()와 동일합니다.
+    """
+    return await asyncio.to_thread(
+        convert,
+        input_path,
+        output_path,
+        input_format=input_format,
+        output_format=output_format,
+        cache_dir=cache_dir,
+    )
+
+
+async def ahwp_to_text(path: PathLike) -> str:
+    """hwp_to_text()의 비동기 버전."""
+    return await asyncio.to_thread(hwp_to_text, path)
+
+
+async def ahwp_to_pdf(
+    path: PathLike,
+    output_path: PathLike,
+    *,
+    chrome: ChromeWorker | None = None,
+    backend: str = PdfBackend.CHROME,
+    html_path: Path | None = None,
+) -> Path:
+    """hwp_to_pdf()의 비동기 버전.
+
+    인자와 반환값, 예외는 hwp_to_pdf()와 동일합니다.
+    """
+    return await asyncio.to_thread(
+        hwp_to_pdf,
+        path,
+        output_path,
+        chrome=chrome,
+        backend=backend,
+        html_path=html_path,
+    )
@@ -7,38 +7,73 @@ pyhwp를 사용하여 HWP 5.0+ 포맷(바이너리 OLE2)을 처리합니다.
 from __future__ import annotations
 
 import re
+import shutil
 import tempfile
-import warnings
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import TYPE_CHECKING, Any, BinaryIO, List, Tuple
 
-from bs4 import BeautifulSoup, NavigableString, XMLParsedAsHTMLWarning
-
-# XML을 HTML 파서로 파싱할 때 경고 억제
-warnings.filterwarnings("ignore", category=XMLParsedAsHTMLWarning)
+import lxml.html
+from lxml import etree
 
+from ._chrome_pool import active_worker
 from ._logging import get_logger
 from ._types import PathLike
 from .constants import (
     CHROME_INSTALL_HINT,
-    CHROME_PATHS,
     DEFAULT_ENCODING,
     PYHWP_INSTALL_HINT,
+    WEASYPRINT_INSTALL_HINT,
     Command,
+    PdfBackend,
 )
-from .exceptions import ConversionError
+from .exceptions import ConversionError, DependencyError, UnsupportedFormatError
 from .utils import (
     check_command_exists,
     create_temp_dir,
     ensure_path,
+    find_chrome,
     move_file,
     run_command,
+    run_command_streaming,
     validate_file_exists,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from ._chrome_pool import ChromeWorker
+
 logger = get_logger("reader")
 
+# 표 변환에 쓰는 XPath (모듈 로드 시 한 번만 컴파일)
+_ROW_XPATH = etree.XPath('.//tr')
+_CELL_XPATH = etree.XPath('./td|./th')
+
+_NEWLINES_RE = re.compile(r'\n{3,}')
+
+# lxml 파서는 스레드 간 공유를 피해야 하므로 스레드마다 하나씩 만들어 재사용
+_parser_state = threading.local()
+
+
+def _html_parser() -> lxml.html.HTMLParser:
+    """현재 스레드의 HTML 파서를 반환합니다 (처음 호출 시 생성).
+
+    huge_tree: 큰 문서에서 libxml2의 기본 크기 제한으로 잘리지 않도록 함
+    """
+    parser = getattr(_parser_state, "parser", None)
+    if parser is None:
+        parser = lxml.html.HTMLParser(encoding=DEFAULT_ENCODING, huge_tree=True)
+        _parser_state.parser = parser
+    return parser
+
+
+# 셀 텍스트: 캐리지 리턴 제거, 줄바꿈은 공백으로 (한 번의 translate로 처리)
+_CR_NL_TABLE = str.maketrans({'\r': None, '\n': ' '})
+
 
 @dataclass(slots=True)
 class HWPDocument:
@@ -59,6 +94,13 @@ class HWPDocument:
     def __str__(self) -> str:
         return self.text
 
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __bool__(self) -> bool:
+        # 본문이 빈 문서도 파싱에 성공한 문서이므로 None과 구분되도록 항상 참
+        return True
+
     def __repr__(self) -> str:
         return f"HWPDocument(path={self.path!r}, text_length={len(self.text)})"
 
@@ -78,7 +120,7 @@ class HWPReader:
         >>> print(reader.text)
     """
 
-    __slots__ = ("path", "_text", "_html", "_rich_text")
+    __slots__ = ("path", "_text", "_html", "_rich_text", "_html_file", "_html_cleanup", "__weakref__")
 
     def __init__(self, path: PathLike) -> None:
         """HWPReader를 초기화합니다.
@@ -93,6 +135,9 @@ class HWPReader:
         self._text: str | None = None
         self._html: str | None = None
         self._rich_text: str | None = None
+        # hwp5html 출력 (html, rich_text, to_pdf가 공유하여 변환을 한 번만 실행)
+        self._html_file: Path | None = None
+        self._html_cleanup: weakref.finalize | None = None
         logger.info("HWPReader 초기화: %s", self.path)
 
     def __enter__(self) -> HWPReader:
@@ -101,8 +146,28 @@ class HWPReader:
 
     def __exit__(self, exc_type: type | None, exc_val: BaseException | None, exc_tb: Any) -> None:
         """컨텍스트 매니저 종료."""
-        # 현재는 정리할 리소스 없음
-        pass
+        self.close()
+
+    def close(self) -> None:
+        """hwp5html 출력 임시 디렉토리를 삭제합니다 (이미 추출한 텍스트/HTML은 유지)."""
+        if self._html_cleanup is not None:
+            self._html_cleanup()
+            self._html_cleanup = None
+        self._html_file = None
+
+    def _ensure_html_file(self) -> Path:
+        """hwp5html 출력을 한 번만 생성하고 HTML 파일 경로를 반환합니다."""
+        if self._html_file is None:
+            html_dir = Path(tempfile.mkdtemp(prefix="hwpparser-html-"))
+            # with 블록 없이 사용해도 객체가 사라질 때 임시 디렉토리 삭제
+            cleanup = weakref.finalize(self, shutil.rmtree, html_dir, True)
+            try:
+                self._html_file = _hwp_to_html_dir(self.path, html_dir)
+            except BaseException:
+                cleanup()
+                raise
+            self._html_cleanup = cleanup
+        return self._html_file
 
     def __repr__(self) -> str:
         return f"HWPReader(path={self.path!r})"
@@ -118,7 +183,7 @@ class HWPReader:
     def html(self) -> str:
         """HWP를 HTML로 변환합니다 (lazy loading)."""
         if self._html is None:
-            self._html = hwp_to_html(self.path)
+            self._html = self._ensure_html_file().read_bytes().decode(DEFAULT_ENCODING)
         return self._html
 
     @property
@@ -128,7 +193,8 @@ class HWPReader:
         HTML을 파싱하여 표를 마크다운 형식으로 포함합니다.
         """
         if self._rich_text is None:
-            self._rich_text = hwp_to_rich_text(self.path)
+            # html 속성과 같은 hwp5html 결과를 재사용
+            self._rich_text = _html_to_rich_text(self.html)
         return self._rich_text
 
     def to_odt(self, output_path: PathLike) -> Path:
@@ -142,16 +208,22 @@ class HWPReader:
         """
         return hwp_to_odt(self.path, output_path)
 
-    def to_pdf(self, output_path: PathLike) -> Path:
-        """HWP를 PDF로 변환합니다 (Chrome headless 사용).
+    def to_pdf(self, output_path: PathLike, *, backend: str = PdfBackend.CHROME) -> Path:
+        """HWP를 PDF로 변환합니다 (기본값: Chrome headless 사용).
 
         Args:
             output_path: 출력 파일 경로
+            backend: 렌더링 백엔드 ("chrome" 또는 "weasyprint")
 
         Returns:
             생성된 PDF 파일 경로
         """
-        return hwp_to_pdf(self.path, output_path)
+        return hwp_to_pdf(
+            self.path,
+            output_path,
+            backend=backend,
+            html_path=self._ensure_html_file(),
+        )
 
     def to_document(self) -> HWPDocument:
         """HWPDocument 데이터 클래스로 반환합니다."""
@@ -174,22 +246,17 @@ def read_hwp(path: PathLike) -> HWPReader:
     return HWPReader(path)
 
 
-def _extract_cell_text(cell) -> str:
+def _extract_cell_text(cell: etree._Element) -> str:
     """테이블 셀에서 텍스트를 추출합니다."""
-    texts = []
-    for elem in cell.descendants:
-        if isinstance(elem, NavigableString):
-            text = str(elem).strip()
-            # 캐리지 리턴 및 특수문자 제거
-            text = text.replace('\r', '').replace('\n', ' ')
-            if text:
-                texts.append(text)
-    return ' '.join(texts).strip()
+    # 캐리지 리턴 및 특수문자 제거 (텍스트 노드만 C 수준에서 순회)
+    return ' '.join(
+        text for text in (node.strip().translate(_CR_NL_TABLE) for node in cell.itertext()) if text
+    )
 
 
-def _parse_table_to_markdown(table) -> str:
+def _parse_table_to_markdown(table: etree._Element) -> str:
     """HTML 테이블을 마크다운 형식으로 변환합니다."""
-    rows = table.find_all('tr')
+    rows = _ROW_XPATH(table)
     if not rows:
         return ""
     
@@ -197,7 +264,7 @@ def _parse_table_to_markdown(table) -> str:
     table_data: List[List[Tuple[str, int, int]]] = []  # (text, rowspan, colspan)
     
     for row in rows:
-        cells = row.find_all(['td', 'th'])
+        cells = _CELL_XPATH(row)
         row_data = []
         for cell in cells:
             text = _extract_cell_text(cell)
@@ -236,43 +303,69 @@ def _parse_table_to_markdown(table) -> str:
     return "\n".join(lines)
 
 
-def _html_to_rich_text(html_content: str) -> str:
-    """HTML을 표를 포함한 리치 텍스트로 변환합니다."""
-    soup = BeautifulSoup(html_content, 'lxml')
-    
-    # 표를 마크다운으로 변환하고 플레이스홀더로 대체
-    tables = soup.find_all('table')
-    table_markdowns = []
-    
-    for i, table in enumerate(tables):
-        md = _parse_table_to_markdown(table)
-        if md:
-            table_markdowns.append(md)
-            # 테이블을 플레이스홀더로 대체
-            placeholder = soup.new_tag('div')
-            placeholder.string = f"__TABLE_{i}__"
-            table.replace_with(placeholder)
-    
-    # 텍스트 추출
-    text_parts = []
-    for elem in soup.body.descendants if soup.body else soup.descendants:
-        if isinstance(elem, NavigableString):
-            text = str(elem).strip()
-            text = text.replace('\r', '')
+def _rich_text_parts(body: etree._Element) -> list[str]:
+    """본문을 문서 순서대로 한 번 순회하며 텍스트 조각과 마크다운 표를 모읍니다.
+
+    트리를 수정하거나 플레이스홀더를 넣지 않고, 표를 만나면 그 자리에 마크다운을
+    넣고 하위 트리는 건너뜁니다. 주석/처리 명령의 내용은 제외하고 꼬리 텍스트는 유지합니다.
+    깊은 문서에서도 재귀 한도에 걸리지 않도록 명시적 스택을 사용합니다.
+    """
+    parts: list[str] = []
+
+    def add(text: str | None) -> None:
+        if text:
+            text = text.strip()
             if text:
-                text_parts.append(text)
+                parts.append(text)
+
+    add(body.text)
+    stack = [(body, iter(body))]
+    while stack:
+        elem, children = stack[-1]
+        child = next(children, None)
+        if child is None:
+            stack.pop()
+            if stack:
+                add(elem.tail)
+            continue
+        if not isinstance(child.tag, str):
+            # 주석 등
+            add(child.tail)
+            continue
+        if child.tag == 'table':
+            md = _parse_table_to_markdown(child)
+            if md:
+                parts.append(f"\n\n{md}\n\n")
+                add(child.tail)
+                continue
+        add(child.text)
+        stack.append((child, iter(child)))
+
+    return parts
+
+
+def _html_to_rich_text(html_content: str | bytes) -> str:
+    """HTML을 표를 포함한 리치 텍스트로 변환합니다.
+
+    파일에서 읽은 UTF-8 bytes를 그대로 넘기면 디코딩/재인코딩 없이 파싱합니다.
+    """
+    if not html_content.strip():
+        return ""
+
+    # hwp5html 출력은 XML 선언이 있는 XHTML이므로 bytes로 파싱
+    if isinstance(html_content, str):
+        html_content = html_content.encode(DEFAULT_ENCODING)
+    root = lxml.html.document_fromstring(html_content, parser=_html_parser())
     
-    # 전체 텍스트 조합
-    full_text = '\n'.join(text_parts)
+    body = root.find('body')
+    if body is None:
+        return ""
     
-    # 플레이스홀더를 실제 테이블로 대체
-    for i, md in enumerate(table_markdowns):
-        placeholder = f"__TABLE_{i}__"
-        if placeholder in full_text:
-            full_text = full_text.replace(placeholder, f"\n\n{md}\n\n")
+    # 전체 텍스트 조합 (캐리지 리턴은 노드별이 아니라 한 번에 제거)
+    full_text = '\n'.join(_rich_text_parts(body)).replace('\r', '')
     
     # 연속된 빈 줄 정리
-    full_text = re.sub(r'\n{3,}', '\n\n', full_text)
+    full_text = _NEWLINES_RE.sub('\n\n', full_text)
     
     return full_text.strip()
 
@@ -290,6 +383,29 @@ def hwp_to_text(path: PathLike) -> str:
     Returns:
         추출된 텍스트
 
+    Raises:
+        DependencyError: pyhwp가 설치되지 않은 경우
+        ConversionError: 변환 실패 시
+    """
+    path = validate_file_exists(path)
+    logger.info("텍스트 추출 시작: %s", path)
+    text = "".join(iter_hwp_text(path))
+    logger.info("텍스트 추출 완료: %d 문자", len(text))
+    return text
+
+
+def iter_hwp_text(path: PathLike) -> Iterator[str]:
+    """HWP 파일의 텍스트를 hwp5txt 출력 순서대로 조각 단위로 돌려줍니다.
+
+    hwp_to_text()와 같은 텍스트를 만들지만 전체를 메모리에 모으지 않으므로,
+    큰 문서를 조각별로 처리(청킹, 색인 등)할 때 사용합니다.
+
+    Args:
+        path: HWP 파일 경로
+
+    Yields:
+        디코딩된 텍스트 조각 (문단 경계와 무관)
+
     Raises:
         DependencyError: pyhwp가 설치되지 않은 경우
         ConversionError: 변환 실패 시
@@ -297,13 +413,33 @@ def hwp_to_text(path: PathLike) -> str:
     path = validate_file_exists(path)
     check_command_exists(Command.HWP5TXT, PYHWP_INSTALL_HINT)
 
-    logger.info("텍스트 추출 시작: %s", path)
-    result = run_command(
+    yield from run_command_streaming(
         [Command.HWP5TXT, str(path)],
         error_message=f"HWP 텍스트 추출 실패: {path}",
     )
-    logger.info("텍스트 추출 완료: %d 문자", len(result.stdout))
-    return result.stdout
+
+
+def stream_hwp_to_text(path: PathLike, out: BinaryIO) -> None:
+    """HWP 파일의 텍스트를 UTF-8 bytes로 스트림에 바로 기록합니다.
+
+    hwp_to_text()와 달리 전체 텍스트를 str로 만들지 않으므로,
+    큰 문서를 파일이나 stdout으로 내보낼 때 메모리 사용량이 일정합니다.
+    기록되는 내용은 hwp_to_text() 결과를 UTF-8로 인코딩한 것과 같습니다.
+
+    Args:
+        path: HWP 파일 경로
+        out: 출력 바이너리 스트림 (예: open(..., "wb"), sys.stdout.buffer)
+
+    Raises:
+        DependencyError: pyhwp가 설치되지 않은 경우
+        ConversionError: 변환 실패 시
+    """
+    logger.info("텍스트 스트리밍 시작: %s", path)
+    # 줄바꿈을 hwp_to_text()와 같게 맞추기 위해 디코딩된 조각을 다시 인코딩
+    # (hwp5txt 출력을 그대로 넘기면 CRLF가 남음)
+    for piece in iter_hwp_text(path):
+        out.write(piece.encode(DEFAULT_ENCODING))
+    logger.info("텍스트 스트리밍 완료: %s", path)
 
 
 def hwp_to_rich_text(path: PathLike) -> str:
@@ -325,8 +461,9 @@ def hwp_to_rich_text(path: PathLike) -> str:
     path = validate_file_exists(path)
     logger.info("리치 텍스트 추출 시작: %s", path)
     
-    # HTML로 변환
-    html_content = hwp_to_html(path)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # HTML로 변환 (str로 디코딩하지 않고 bytes 그대로 파서에 전달)
+        html_content = _hwp_to_html_dir(path, Path(temp_dir)).read_bytes()
     
     # HTML을 리치 텍스트로 변환
     rich_text = _html_to_rich_text(html_content)
@@ -372,11 +509,41 @@ def hwp_to_html(path: PathLike, output_dir: Path | None = None) -> str:
     else:
         html_file = output_target
 
-    html_content = html_file.read_text(encoding=DEFAULT_ENCODING)
+    # 텍스트 모드(줄 단위 디코딩, 줄바꿈 변환) 대신 한 번에 읽고 디코딩
+    html_content = html_file.read_bytes().decode(DEFAULT_ENCODING)
     logger.info("HTML 변환 완료: %d 문자", len(html_content))
     return html_content
 
 
+def hwp_to_html_to_file(path: PathLike, output_path: PathLike) -> Path:
+    """HWP를 HTML로 변환하여 파일에 바로 저장합니다.
+
+    hwp5html이 XHTML을 출력 파일에 직접 기록하므로, 큰 문서도 Python 쪽에서
+    전체 HTML 문자열을 만들지 않습니다. 문자열이 필요하면 hwp_to_html()을 사용하세요.
+
+    Args:
+        path: HWP 파일 경로
+        output_path: 출력 HTML 파일 경로
+
+    Returns:
+        생성된 HTML 파일 경로
+    """
+    path = validate_file_exists(path)
+    output_path = ensure_path(output_path)
+    check_command_exists(Command.HWP5HTML, PYHWP_INSTALL_HINT)
+
+    logger.info("HTML 변환 시작: %s → %s", path, output_path)
+    run_command(
+        [Command.HWP5HTML, "--html", "--output", str(output_path), str(path)],
+        error_message=f"HWP → HTML 변환 실패: {path}",
+    )
+    if not output_path.exists():
+        raise ConversionError(f"HTML 파일이 생성되지 않았습니다: {output_path}")
+
+    logger.info("HTML 변환 완료: %s", output_path)
+    return output_path
+
+
 def hwp_to_odt(path: PathLike, output_path: PathLike) -> Path:
     """HWP를 ODT로 변환합니다.
 
@@ -402,75 +569,241 @@ def hwp_to_odt(path: PathLike, output_path: PathLike) -> Path:
     return output_path
 
 
-def _find_chrome() -> str | None:
-    """시스템에 설치된 Chrome/Chromium 경로를 찾습니다."""
-    for chrome_path in CHROME_PATHS:
-        if Path(chrome_path).exists():
-            return chrome_path
-    return None
+_PDF_BACKENDS = frozenset(b.value for b in PdfBackend)
+
+
+def _render_pdf_weasyprint(html_file: Path, output_path: Path) -> None:
+    """WeasyPrint로 HTML 파일을 PDF로 렌더링합니다 (외부 프로세스 없음)."""
+    try:
+        from weasyprint import HTML
+    except ImportError as e:
+        raise DependencyError("weasyprint", WEASYPRINT_INSTALL_HINT) from e
+
+    try:
+        HTML(filename=str(html_file)).write_pdf(str(output_path))
+    except Exception as e:
+        raise ConversionError(f"HTML → PDF 변환 실패: {html_file} ({e})") from e
+
 
+def _hwp_to_html_dir(path: Path, output_dir: Path) -> Path:
+    """hwp5html로 output_dir에 HTML(리소스 포함)을 생성하고 HTML 파일 경로를 반환합니다."""
+    check_command_exists(Command.HWP5HTML, PYHWP_INSTALL_HINT)
+    run_command(
+        [Command.HWP5HTML, str(path), "--output", str(output_dir)],
+        error_message=f"HWP → HTML 변환 실패: {path}",
+    )
+
+    # HTML 파일 찾기
+    html_file = output_dir / "index.xhtml"
+    if not html_file.exists():
+        html_file = output_dir / "index.html"
+    if not html_file.exists():
+        raise ConversionError(f"HTML 파일이 생성되지 않았습니다: {output_dir}")
+    return html_file
+
+
+def _resolve_pdf_renderer(
+    backend: str,
+    chrome: ChromeWorker | None,
+) -> tuple[ChromeWorker | None, str | None]:
+    """PDF 백엔드를 확인하고 (ChromeWorker, 일회성 Chrome 경로)를 반환합니다."""
+    if backend not in _PDF_BACKENDS:
+        raise UnsupportedFormatError(backend, [b.value for b in PdfBackend])
+    if backend != PdfBackend.CHROME:
+        return None, None
+    if chrome is None:
+        chrome = active_worker()
+    if chrome is not None:
+        return chrome, None
+    chrome_path = find_chrome()
+    if chrome_path is None:
+        raise DependencyError("chrome", CHROME_INSTALL_HINT)
+    return None, chrome_path
 
-def hwp_to_pdf(path: PathLike, output_path: PathLike) -> Path:
+
+def _render_pdf(
+    html_file: Path,
+    output_path: Path,
+    backend: str,
+    chrome: ChromeWorker | None,
+    chrome_path: str | None,
+    profile_dir: Path | None = None,
+) -> None:
+    """HTML 파일을 선택된 백엔드로 PDF로 렌더링합니다.
+
+    profile_dir를 주면 일회성 Chrome이 별도 프로필을 사용하므로
+    여러 Chrome을 동시에 실행해도 프로필 잠금으로 충돌하지 않습니다.
+    """
+    if backend == PdfBackend.WEASYPRINT:
+        _render_pdf_weasyprint(html_file, output_path)
+    elif chrome is not None:
+        try:
+            chrome.render_html_to_pdf(html_file, output_path)
+        except ConversionError as e:
+            # 워커가 실패하면 일회성 Chrome 실행으로 한 번 더 시도
+            logger.warning("Chrome 워커 인쇄 실패, 일회성 실행으로 재시도: %s", e)
+            _render_pdf(html_file, output_path, backend, None, chrome.chrome_path, profile_dir)
+            return
+    else:
+        assert chrome_path is not None
+        args = [
+            chrome_path,
+            "--headless",
+            "--disable-gpu",
+            "--no-sandbox",
+            "--print-to-pdf=" + str(output_path),
+            "--print-to-pdf-no-header",
+        ]
+        if profile_dir is not None:
+            args.append(f"--user-data-dir={profile_dir}")
+        args.append(f"file://{html_file}")
+        run_command(args, error_message=f"HTML → PDF 변환 실패: {html_file}")
+
+    if not output_path.exists():
+        raise ConversionError(f"PDF 파일이 생성되지 않았습니다: {output_path}")
+
+
+def hwp_to_pdf(
+    path: PathLike,
+    output_path: PathLike,
+    *,
+    chrome: ChromeWorker | None = None,
+    backend: str = PdfBackend.CHROME,
+    html_path: Path | None = None,
+) -> Path:
     """HWP를 PDF로 변환합니다.
 
-    HTML을 거쳐 Chrome headless로 PDF를 생성합니다.
+    HTML을 거쳐 PDF를 생성합니다. 기본 백엔드는 Chrome headless이며,
+    ChromeWorker가 주어지거나 with 블록으로 열려 있으면 실행 중인 Chrome을
+    재사용하고, 그렇지 않으면 변환마다 Chrome을 새로 실행합니다.
+    backend="weasyprint"이면 Chrome 없이 프로세스 안에서 렌더링합니다.
 
     Args:
         path: HWP 파일 경로
         output_path: 출력 PDF 파일 경로
+        chrome: 재사용할 ChromeWorker (None이면 현재 컨텍스트에서 with로 연 워커 또는 일회성 실행)
+        backend: 렌더링 백엔드 ("chrome" 또는 "weasyprint")
+        html_path: 이미 생성된 hwp5html 출력의 HTML 파일 (주면 HWP → HTML 변환 생략)
 
     Returns:
         생성된 PDF 파일 경로
 
     Raises:
-        DependencyError: Chrome이 설치되지 않은 경우
+        DependencyError: Chrome 또는 WeasyPrint가 설치되지 않은 경우
+        UnsupportedFormatError: 알 수 없는 백엔드인 경우
         ConversionError: 변환 실패 시
     """
     path = validate_file_exists(path)
     output_path = ensure_path(output_path)
+    chrome, chrome_path = _resolve_pdf_renderer(backend, chrome)
 
-    chrome_path = _find_chrome()
-    if chrome_path is None:
-        from .exceptions import DependencyError
-        raise DependencyError("chrome", CHROME_INSTALL_HINT)
+    logger.info("PDF 변환 시작 (%s): %s → %s", backend, path, output_path)
 
-    logger.info("PDF 변환 시작 (Chrome headless): %s → %s", path, output_path)
+    if html_path is not None:
+        _render_pdf(html_path, output_path, backend, chrome, chrome_path)
+        logger.info("PDF 변환 완료: %s", output_path)
+        return output_path
 
     with tempfile.TemporaryDirectory() as temp_dir:
-        temp_dir_path = Path(temp_dir)
-        html_output_dir = temp_dir_path / "html"
+        html_output_dir = Path(temp_dir) / "html"
         html_output_dir.mkdir()
 
-        # HWP → HTML
-        check_command_exists(Command.HWP5HTML, PYHWP_INSTALL_HINT)
-        run_command(
-            [Command.HWP5HTML, str(path), "--output", str(html_output_dir)],
-            error_message=f"HWP → HTML 변환 실패: {path}",
-        )
-
-        # HTML 파일 찾기
-        html_file = html_output_dir / "index.xhtml"
-        if not html_file.exists():
-            html_file = html_output_dir / "index.html"
-        if not html_file.exists():
-            raise ConversionError(f"HTML 파일이 생성되지 않았습니다: {html_output_dir}")
-
-        # HTML → PDF (Chrome headless)
-        run_command(
-            [
-                chrome_path,
-                "--headless",
-                "--disable-gpu",
-                "--no-sandbox",
-                "--print-to-pdf=" + str(output_path),
-                "--print-to-pdf-no-header",
-                f"file://{html_file}",
-            ],
-            error_message=f"HTML → PDF 변환 실패: {html_file}",
-        )
-
-        if not output_path.exists():
-            raise ConversionError(f"PDF 파일이 생성되지 않았습니다: {output_path}")
+        # HWP → HTML → PDF
+        html_file = _hwp_to_html_dir(path, html_output_dir)
+        _render_pdf(html_file, output_path, backend, chrome, chrome_path)
 
     logger.info("PDF 변환 완료: %s", output_path)
     return output_path
+
+
+def hwp_batch_to_pdf(
+    items: Sequence[tuple[PathLike, PathLike]],
+    *,
+    html_workers: int = 4,
+    pdf_workers: int = 2,
+    chrome: ChromeWorker | None = None,
+    backend: str = PdfBackend.CHROME,
+) -> list[Path]:
+    """여러 HWP를 PDF로 변환하되 HTML 변환과 PDF 렌더링을 겹쳐서 실행합니다.
+
+    hwp5html 단계와 PDF 렌더링 단계를 각각의 스레드 풀에서 실행하고,
+    HTML이 준비되는 대로 바로 렌더링 단계로 넘깁니다. 두 단계 모두 외부
+    프로세스(또는 ChromeWorker)를 기다리는 시간이 대부분이라 스레드로 충분합니다.
+    ChromeWorker를 쓰면 렌더링은 워커 안에서 직렬화되므로 pdf_workers는 1이면 됩니다.
+
+    Args:
+        items: (HWP 파일 경로, 출력 PDF 경로) 목록
+        html_workers: 동시에 실행할 hwp5html 수
+        pdf_workers: 동시에 실행할 PDF 렌더링 수
+        chrome: 재사용할 ChromeWorker (None이면 현재 컨텍스트에서 with로 연 워커 또는 일회성 실행)
+        backend: 렌더링 백엔드 ("chrome" 또는 "weasyprint")
+
+    Returns:
+        입력 순서대로 생성된 PDF 파일 경로
+
+    Raises:
+        DependencyError: Chrome 또는 WeasyPrint가 설치되지 않은 경우
+        ConversionError: 변환 실패 시 (나머지 작업이 끝난 뒤 첫 오류를 전파)
+
+    Example:
+        >>> hwp_batch_to_pdf([("a.hwp", "a.pdf"), ("b.hwp", "b.pdf")])
+    """
+    jobs = [(validate_file_exists(src), ensure_path(dst)) for src, dst in items]
+    chrome, chrome_path = _resolve_pdf_renderer(backend, chrome)
+    if not jobs:
+        return []
+
+    logger.info("PDF 배치 변환 시작 (%s): %d개 파일", backend, len(jobs))
+
+    with tempfile.TemporaryDirectory() as temp_dir, \
+            ThreadPoolExecutor(max_workers=max(1, html_workers)) as html_pool, \
+            ThreadPoolExecutor(max_workers=max(1, pdf_workers)) as pdf_pool:
+        temp_dir_path = Path(temp_dir)
+
+        def render(index: int, html_file: Path) -> Path:
+            output_path = jobs[index][1]
+            try:
+                _render_pdf(
+                    html_file,
+                    output_path,
+                    backend,
+                    chrome,
+                    chrome_path,
+                    profile_dir=temp_dir_path / f"profile-{index}",
+                )
+            finally:
+                # 렌더링이 끝난 HTML은 바로 지워 임시 디스크 사용량을 제한
+                shutil.rmtree(html_file.parent, ignore_errors=True)
+                shutil.rmtree(temp_dir_path / f"profile-{index}", ignore_errors=True)
+            return output_path
+
+        def to_html(index: int) -> Path:
+            html_dir = temp_dir_path / f"html-{index}"
+            html_dir.mkdir()
+            return _hwp_to_html_dir(jobs[index][0], html_dir)
+
+        html_futures = {html_pool.submit(to_html, i): i for i in range(len(jobs))}
+        pdf_futures = {}
+        first_error: BaseException | None = None
+
+        # HTML이 완성되는 순서대로 렌더링 단계에 투입
+        for future in as_completed(html_futures):
+            index = html_futures[future]
+            try:
+                html_file = future.result()
+            except Exception as e:
+                first_error = first_error or e
+                continue
+            pdf_futures[index] = pdf_pool.submit(render, index, html_file)
+
+        for index in sorted(pdf_futures):
+            try:
+                pdf_futures[index].result()
+            except Exception as e:
+                first_error = first_error or e
+
+    if first_error is not None:
+        raise first_error
+
+    logger.info("PDF 배치 변환 완료: %d개 파일", len(jobs))
+    return [output_path for _src, output_path in jobs]
@@ -6,22 +6,42 @@ HWP Parser 유틸리티 함수
 
 from __future__ import annotations
 
+import codecs
+import contextlib
+import functools
+import io
+import os
 import shutil
 import subprocess
 import tempfile
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 from ._logging import get_logger
 from ._types import PathLike
-from .constants import DEFAULT_ENCODING, EXTENSION_TO_FORMAT
+from .constants import (
+    BATCH_WORKERS_ENV,
+    CHROME_COMMANDS,
+    CHROME_PATHS,
+    DEFAULT_ENCODING,
+    EXTENSION_TO_FORMAT_MEMBER,
+    STREAM_CHUNK_SIZE,
+)
 from .exceptions import ConversionError, DependencyError, HWPFileNotFoundError
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
 
 logger = get_logger("utils")
 
+# PEP 446 이후 Python이 여는 fd는 기본적으로 상속되지 않으므로 POSIX에서는
+# close_fds를 끄고, subprocess가 fork+exec 대신 posix_spawn을 쓰게 함
+_SPAWN_CLOSE_FDS = os.name != "posix"
+
+# validation_cache() 블록 안에서 존재가 확인된 경로 (스레드별)
+_validation_state = threading.local()
+
 
 def ensure_path(path: PathLike) -> Path:
     """문자열 또는 Path를 Path 객체로 변환합니다.
@@ -32,7 +52,7 @@ def ensure_path(path: PathLike) -> Path:
     Returns:
         Path 객체
     """
-    return Path(path) if isinstance(path, str) else Path(path)
+    return path if isinstance(path, Path) else Path(path)
 
 
 def validate_file_exists(path: PathLike) -> Path:
@@ -47,12 +67,67 @@ def validate_file_exists(path: PathLike) -> Path:
     Raises:
         HWPFileNotFoundError: 파일이 없을 경우
     """
-    resolved = ensure_path(path)
-    if not resolved.exists():
-        logger.error("파일을 찾을 수 없습니다: %s", resolved)
-        raise HWPFileNotFoundError(str(resolved))
-    logger.debug("파일 확인됨: %s", resolved)
-    return resolved
+    return ensure_path(validate_file_exists_str(path))
+
+
+def validate_file_exists_str(path: PathLike) -> str:
+    """파일 존재 여부를 확인하고 문자열 경로를 반환합니다.
+
+    Path 객체를 만들지 않으므로 경로를 그대로 subprocess에 넘길 때 사용합니다.
+
+    Args:
+        path: 확인할 파일 경로
+
+    Returns:
+        문자열 경로
+
+    Raises:
+        HWPFileNotFoundError: 파일이 없을 경우
+    """
+    path_str = os.fspath(path)
+    validated: set[str] | None = getattr(_validation_state, "paths", None)
+    if validated is not None and path_str in validated:
+        return path_str
+    if not os.path.exists(path_str):
+        logger.error("파일을 찾을 수 없습니다: %s", path_str)
+        raise HWPFileNotFoundError(path_str)
+    if validated is not None:
+        validated.add(path_str)
+    logger.debug("파일 확인됨: %s", path_str)
+    return path_str
+
+
+@contextlib.contextmanager
+def validation_cache(known: Iterable[PathLike] = ()) -> Iterator[None]:
+    """블록 안에서 파일 존재 확인 결과를 재사용합니다 (현재 스레드 한정).
+
+    배치 처리처럼 convert()와 reader 함수가 같은 경로를 반복 확인하는 구간에서
+    중복 stat 호출을 없앱니다. 블록을 벗어나면 결과를 버리므로 오래된 결과가 남지 않습니다.
+
+    Args:
+        known: 이미 존재가 확인된 경로 (예: glob 결과)
+    """
+    previous = getattr(_validation_state, "paths", None)
+    _validation_state.paths = {os.fspath(p) for p in known}
+    try:
+        yield
+    finally:
+        _validation_state.paths = previous
+
+
+@functools.lru_cache(maxsize=None)
+def _which_cached(command: str) -> str | None:
+    """shutil.which 결과를 프로세스당 한 번만 계산합니다 (PATH의 디렉토리마다 stat 호출)."""
+    return shutil.which(command)
+
+
+def clear_path_cache() -> None:
+    """명령어/Chrome 경로 캐시를 비웁니다.
+
+    프로세스 실행 중에 도구를 설치하거나 PATH를 바꾼 경우(주로 테스트) 호출합니다.
+    """
+    _which_cached.cache_clear()
+    find_chrome.cache_clear()
 
 
 def check_command_exists(command: str, install_hint: str = "") -> None:
@@ -65,27 +140,65 @@ def check_command_exists(command: str, install_hint: str = "") -> None:
     Raises:
         DependencyError: 명령어가 없을 경우
     """
-    if shutil.which(command) is None:
+    if _which_cached(command) is None:
         logger.error("명령어를 찾을 수 없습니다: %s", command)
         raise DependencyError(command, install_hint)
     logger.debug("명령어 확인됨: %s", command)
 
 
+@functools.lru_cache(maxsize=None)
+def find_chrome() -> str | None:
+    """시스템에 설치된 Chrome/Chromium 경로를 찾습니다.
+
+    CHROME_PATHS를 순서대로 확인한 뒤 PATH에서 CHROME_COMMANDS를 찾습니다.
+    결과는 프로세스당 한 번만 계산합니다.
+
+    Returns:
+        실행 파일 경로, 없으면 None
+    """
+    for chrome_path in CHROME_PATHS:
+        if os.access(chrome_path, os.X_OK):
+            return chrome_path
+    for command in CHROME_COMMANDS:
+        found = _which_cached(command)
+        if found is not None:
+            return found
+    return None
+
+
+def _spawn_argv(args_list: list[str]) -> list[str]:
+    """실행 파일을 절대 경로로 바꾼 인자 목록을 반환합니다.
+
+    subprocess는 실행 파일이 경로로 주어졌을 때만 posix_spawn을 사용하므로,
+    PATH 조회 결과(캐시됨)로 명령어 이름을 대체합니다. 찾지 못하면 그대로 둡니다.
+    """
+    command = args_list[0]
+    if os.sep in command:
+        return args_list
+    resolved = _which_cached(command)
+    if resolved is None:
+        return args_list
+    return [resolved, *args_list[1:]]
+
+
 def run_command(
     args: Sequence[str],
     *,
     check: bool = True,
     capture_output: bool = True,
-    text: bool = True,
+    text: bool = False,
     error_message: str = "",
-) -> subprocess.CompletedProcess[str]:
+) -> subprocess.CompletedProcess[Any]:
     """subprocess를 실행하고 에러를 처리합니다.
 
+    기본적으로 출력을 bytes로 받습니다. 큰 출력은 호출자가 decode_output()으로
+    한 번에 디코딩하는 편이 텍스트 모드의 점진적 디코딩보다 빠릅니다.
+
     Args:
         args: 실행할 명령어와 인자들
         check: 실패 시 예외 발생 여부
         capture_output: 출력 캡처 여부
-        text: 텍스트 모드 여부
+        text: 텍스트 모드 여부 (기본값: False, bytes 반환)
         error_message: 에러 시 표시할 메시지
 
     Returns:
@@ -100,17 +213,21 @@ def run_command(
 
     try:
         result = subprocess.run(
-            args_list,
+            _spawn_argv(args_list),
             check=check,
             capture_output=capture_output,
             text=text,
+            close_fds=_SPAWN_CLOSE_FDS,
         )
         logger.debug("명령어 성공: %s", args_list[0])
         return result
     except subprocess.CalledProcessError as e:
         message = error_message or f"명령어 실행 실패: {' '.join(args_list)}"
         if e.stderr:
-            message += f"\n{e.stderr}"
+            stderr = e.stderr
+            if isinstance(stderr, bytes):
+                stderr = stderr.decode(DEFAULT_ENCODING, errors="replace")
+            message += f"\n{stderr}"
         logger.error(message)
         raise ConversionError(message) from e
     except FileNotFoundError as e:
@@ -118,17 +235,176 @@ def run_command(
         raise DependencyError(args_list[0]) from e
 
 
+def decode_output(data: bytes) -> str:
+    """명령어 출력(bytes)을 텍스트 모드(text=True)와 같은 문자열로 디코딩합니다.
+
+    텍스트 모드의 universal newlines처럼 CRLF와 CR을 LF로 바꿉니다.
+
+    Args:
+        data: 명령어 stdout bytes
+
+    Returns:
+        디코딩된 문자열
+    """
+    text = data.decode(DEFAULT_ENCODING)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def run_command_to_stream(
+    args: Sequence[str],
+    out: BinaryIO,
+    *,
+    error_message: str = "",
+) -> None:
+    """명령어의 stdout을 Python에서 모으지 않고 바이너리 스트림으로 바로 보냅니다.
+
+    out이 실제 파일 디스크립터를 가지면 자식 프로세스가 직접 기록하고,
+    그렇지 않으면(예: io.BytesIO) 고정 크기 버퍼로 복사합니다.
+
+    Args:
+        args: 실행할 명령어와 인자들
+        out: 출력 바이너리 스트림
+        error_message: 에러 시 표시할 메시지
+
+    Raises:
+        ConversionError: 명령어 실행 실패 시
+        DependencyError: 명령어가 없을 경우
+    """
+    args_list = list(args)
+    logger.debug("명령어 실행 (스트리밍): %s", " ".join(args_list))
+
+    try:
+        out.fileno()
+        direct = True
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        direct = False
+
+    # stderr는 파이프 대신 임시 파일로 받아 stdout 복사 중 교착을 피함
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            if direct:
+                out.flush()
+                returncode = subprocess.run(
+                    _spawn_argv(args_list),
+                    stdout=out,
+                    stderr=stderr_file,
+                    close_fds=_SPAWN_CLOSE_FDS,
+                ).returncode
+            else:
+                with subprocess.Popen(
+                    _spawn_argv(args_list),
+                    stdout=subprocess.PIPE,
+                    stderr=stderr_file,
+                    close_fds=_SPAWN_CLOSE_FDS,
+                ) as proc:
+                    assert proc.stdout is not None
+                    shutil.copyfileobj(proc.stdout, out)
+                returncode = proc.returncode
+        except FileNotFoundError as e:
+            logger.error("명령어를 찾을 수 없습니다: %s", args_list[0])
+            raise DependencyError(args_list[0]) from e
+
+        if returncode != 0:
+            message = error_message or f"명령어 실행 실패: {' '.join(args_list)}"
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(DEFAULT_ENCODING, errors="replace")
+            if stderr:
+                message += f"\n{stderr}"
+            logger.error(message)
+            raise ConversionError(message)
+
+    logger.debug("명령어 성공: %s", args_list[0])
+
+
+def run_command_streaming(
+    args: Sequence[str],
+    *,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    error_message: str = "",
+) -> Iterator[str]:
+    """명령어의 stdout을 chunk_size 단위로 읽어 디코딩된 문자열 조각으로 돌려줍니다.
+
+    출력 전체를 bytes로 모은 뒤 str로 다시 만드는 대신 조각별로 디코딩하므로,
+    큰 출력에서도 첫 조각을 빨리 받고 최대 메모리 사용량이 작습니다.
+    멀티바이트 문자나 CRLF가 조각 경계에서 잘려도 증분 디코더가 이어 붙이며,
+    줄바꿈은 텍스트 모드(decode_output())와 같이 LF로 통일합니다.
+
+    Args:
+        args: 실행할 명령어와 인자들
+        chunk_size: 한 번에 읽을 바이트 수 (기본값: 64 KiB)
+        error_message: 에러 시 표시할 메시지
+
+    Yields:
+        디코딩된 stdout 조각
+
+    Raises:
+        ConversionError: 명령어 실행 실패 시 (모든 조각을 내보낸 뒤 발생)
+        DependencyError: 명령어가 없을 경우
+    """
+    args_list = list(args)
+    logger.debug("명령어 실행 (스트리밍): %s", " ".join(args_list))
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(DEFAULT_ENCODING)(),
+        translate=True,
+    )
+
+    # stderr는 파이프 대신 임시 파일로 받아 stdout 읽기 중 교착을 피함
+    with tempfile.TemporaryFile() as stderr_file:
+        try:
+            proc = subprocess.Popen(
+                _spawn_argv(args_list),
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                bufsize=0,
+                close_fds=_SPAWN_CLOSE_FDS,
+            )
+        except FileNotFoundError as e:
+            logger.error("명령어를 찾을 수 없습니다: %s", args_list[0])
+            raise DependencyError(args_list[0]) from e
+
+        with proc:
+            assert proc.stdout is not None
+            try:
+                for chunk in iter(lambda: proc.stdout.read(chunk_size), b""):
+                    text = decoder.decode(chunk)
+                    if text:
+                        yield text
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+            except GeneratorExit:
+                # 소비자가 중간에 멈추면 자식 프로세스를 정리
+                proc.kill()
+                raise
+
+        if proc.returncode != 0:
+            message = error_message or f"명령어 실행 실패: {' '.join(args_list)}"
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(DEFAULT_ENCODING, errors="replace")
+            if stderr:
+                message += f"\n{stderr}"
+            logger.error(message)
+            raise ConversionError(message)
+
+    logger.debug("명령어 성공: %s", args_list[0])
+
+
 def create_temp_file(
-    content: str,
+    content: str | bytes,
     suffix: str = ".txt",
     encoding: str = DEFAULT_ENCODING,
+    *,
+    directory: PathLike | None = None,
 ) -> Path:
     """임시 파일을 생성하고 경로를 반환합니다.
 
     Args:
-        content: 파일에 쓸 내용
+        content: 파일에 쓸 내용 (bytes는 인코딩 없이 그대로 기록)
         suffix: 파일 확장자
-        encoding: 인코딩
+        encoding: 인코딩 (str 내용일 때만 사용)
+        directory: 임시 파일을 만들 디렉토리 (None이면 시스템 임시 디렉토리)
 
     Returns:
         생성된 임시 파일 경로
@@ -136,13 +412,8 @@ def create_temp_file(
     Note:
         호출자가 파일 삭제를 책임집니다.
     """
-    with tempfile.NamedTemporaryFile(
-        mode="w",
-        suffix=suffix,
-        delete=False,
-        encoding=encoding,
-    ) as f:
-        f.write(content)
+    with tempfile.NamedTemporaryFile(suffix=suffix, dir=directory, delete=False) as f:
+        f.write(content if isinstance(content, bytes) else content.encode(encoding))
         path = Path(f.name)
         logger.debug("임시 파일 생성: %s", path)
         return path
@@ -179,6 +450,16 @@ def move_file(src: PathLike, dst: PathLike) -> Path:
     return dst_path
 
 
+@functools.lru_cache(maxsize=256)
+def _format_from_suffix(suffix: str) -> str:
+    """확장자 문자열에서 포맷을 찾습니다 (결과 캐싱).
+
+    알려진 확장자는 InputFormat/OutputFormat 멤버(str 하위 클래스)를 반환합니다.
+    """
+    ext = suffix.lower()
+    return EXTENSION_TO_FORMAT_MEMBER.get(ext) or ext.lstrip(".")
+
+
 def get_format_from_extension(path: PathLike) -> str:
     """파일 확장자에서 포맷을 추출합니다.
 
@@ -188,8 +469,24 @@ def get_format_from_extension(path: PathLike) -> str:
     Returns:
         소문자 포맷 문자열 (예: 'hwp', 'pdf')
     """
-    ext = ensure_path(path).suffix.lower()
-    return EXTENSION_TO_FORMAT.get(ext, ext.lstrip("."))
+    return _format_from_suffix(os.path.splitext(os.fspath(path))[1])
+
+
+def default_max_workers() -> int:
+    """병렬 처리 기본 워커 수를 반환합니다.
+
+    HWPPARSER_BATCH_WORKERS 환경 변수가 있으면 그 값을, 없으면 CPU 수 - 1을 사용합니다.
+
+    Returns:
+        1 이상의 워커 수
+    """
+    env_value = os.environ.get(BATCH_WORKERS_ENV)
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            logger.warning("잘못된 %s 값 무시: %s", BATCH_WORKERS_ENV, env_value)
+    return max(1, (os.cpu_count() or 2) - 1)
 
 
 # 하위 호환성을 위해 PathLike 재export
@@ -197,10 +494,18 @@ __all__ = [
     "PathLike",
     "ensure_path",
     "validate_file_exists",
+    "validate_file_exists_str",
+    "validation_cache",
     "check_command_exists",
+    "clear_path_cache",
+    "find_chrome",
     "run_command",
+    "decode_output",
+    "run_command_to_stream",
+    "run_command_streaming",
     "create_temp_file",
     "create_temp_dir",
     "move_file",
     "get_format_from_extension",
+    "default_max_workers",
 ]
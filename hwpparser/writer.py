@@ -6,8 +6,11 @@ pypandoc-hwpx를 사용하여 HWPX(XML 기반) 포맷으로 변환합니다.
 
 from __future__ import annotations
 
+import functools
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Any, Callable, Literal
 
 from ._logging import get_logger
 from ._types import PathLike
@@ -16,19 +19,27 @@ from .constants import (
     PYPANDOC_INSTALL_HINT,
     Command,
 )
+from .exceptions import ConversionError, DependencyError
 from .utils import (
     check_command_exists,
     create_temp_file,
+    default_max_workers,
     ensure_path,
     run_command,
     validate_file_exists,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = get_logger("writer")
 
 # 지원하는 입력 포맷
 InputFormat = Literal["markdown", "html", "docx"]
 
+# 콘텐츠 포맷 → 임시 파일 확장자 (pypandoc-hwpx는 확장자로 입력 포맷을 판단)
+_CONTENT_SUFFIXES = {"markdown": ".md", "html": ".html"}
+
 
 class HWPXWriter:
     """다양한 소스에서 HWPX 문서를 생성하는 클래스.
@@ -111,15 +122,82 @@ class HWPXWriter:
         return output_path
 
 
+class BatchHWPXWriter:
+    """여러 HWPX 파일을 연속으로 만들 때 변환기 준비 비용을 한 번만 치르는 Writer.
+
+    pypandoc-hwpx CLI는 파일마다 Python 인터프리터를 새로 띄우고 pypandoc, PIL
+    등을 다시 임포트합니다. 이 클래스는 같은 환경에 설치된 pypandoc_hwpx 모듈을
+    with 블록 시작 시 한 번만 임포트하고 변환 함수를 프로세스 안에서 직접
+    호출합니다 (pandoc 자체는 pypandoc이 파일마다 실행). 모듈을 임포트할 수 없으면
+    CLI 실행으로 대체합니다. 중간 파일은 블록 동안 유지되는 임시 디렉토리 하나에
+    만듭니다.
+
+    Example:
+        >>> with BatchHWPXWriter() as writer:
+        ...     for i, report in enumerate(reports):
+        ...         writer.write(report, f"report_{i}.hwpx")
+    """
+
+    __slots__ = ("_in_process", "_temp_dir")
+
+    def __init__(self) -> None:
+        """BatchHWPXWriter를 초기화합니다 (변환기는 with 블록 시작 시 준비)."""
+        self._in_process = False
+        self._temp_dir: tempfile.TemporaryDirectory[str] | None = None
+
+    def __enter__(self) -> BatchHWPXWriter:
+        self._in_process = _load_in_process_converter() is not None
+        if not self._in_process:
+            check_command_exists(Command.PYPANDOC_HWPX, PYPANDOC_INSTALL_HINT)
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="hwpparser-hwpx-")
+        return self
+
+    def __exit__(self, exc_type: type | None, exc_val: BaseException | None, exc_tb: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"BatchHWPXWriter(in_process={self._in_process})"
+
+    def close(self) -> None:
+        """임시 디렉토리를 정리합니다."""
+        if self._temp_dir is not None:
+            self._temp_dir.cleanup()
+            self._temp_dir = None
+
+    def write(
+        self,
+        content: str | bytes,
+        output_path: PathLike,
+        content_format: str = "markdown",
+    ) -> Path:
+        """콘텐츠를 HWPX 파일로 저장합니다.
+
+        Args:
+            content: 저장할 콘텐츠 (마크다운, HTML 등, bytes는 UTF-8로 간주)
+            output_path: 출력 HWPX 파일 경로
+            content_format: 입력 콘텐츠 포맷 (markdown, html)
+
+        Returns:
+            생성된 HWPX 파일 경로
+
+        Raises:
+            ConversionError: with 블록 밖에서 호출했거나 변환 실패 시
+        """
+        if self._temp_dir is None:
+            raise ConversionError("BatchHWPXWriter는 with 블록 안에서 사용해야 합니다.")
+        write = _write_hwpx_in_process if self._in_process else _write_hwpx
+        return write(content, ensure_path(output_path), content_format, temp_dir=Path(self._temp_dir.name))
+
+
 def write_hwpx(
-    content: str,
+    content: str | bytes,
     output_path: PathLike,
     content_format: str = "markdown",
 ) -> Path:
     """콘텐츠를 HWPX 파일로 저장합니다.
 
     Args:
-        content: 저장할 콘텐츠 (마크다운, HTML 등)
+        content: 저장할 콘텐츠 (마크다운, HTML 등, bytes는 UTF-8로 간주)
         output_path: 출력 HWPX 파일 경로
         content_format: 입력 콘텐츠 포맷 (markdown, html)
 
@@ -127,14 +205,154 @@ def write_hwpx(
         생성된 HWPX 파일 경로
     """
     check_command_exists(Command.PYPANDOC_HWPX, PYPANDOC_INSTALL_HINT)
-    output_path = ensure_path(output_path)
+    return _write_hwpx(content, ensure_path(output_path), content_format)
+
+
+def batch_write_hwpx(
+    items: Sequence[tuple[str | bytes, PathLike]],
+    content_format: str = "markdown",
+    *,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """여러 콘텐츠를 동시에 HWPX 파일로 저장합니다.
+
+    pypandoc_hwpx 모듈을 임포트할 수 있으면 워커 프로세스마다 변환기를 한 번만
+    임포트하고 여러 파일을 프로세스 안에서 변환하므로, 파일 N개에 대한 Python
+    시작 비용이 워커 수만큼으로 줄어듭니다. 모듈이 없으면 파일마다 pypandoc-hwpx
+    CLI를 실행하고 Python은 종료를 기다리기만 하므로 스레드 풀을 사용합니다.
+    중간 파일은 배치 전체에서 공유하는 임시 디렉토리 하나에 만들고 배치가 끝나면
+    함께 지웁니다.
+
+    Args:
+        items: (콘텐츠, 출력 HWPX 경로) 목록
+        content_format: 입력 콘텐츠 포맷 (markdown, html)
+        max_workers: 동시에 실행할 변환 수 (None이면 HWPPARSER_BATCH_WORKERS 또는 CPU 수 - 1)
+
+    Returns:
+        입력 순서대로 생성된 HWPX 파일 경로
+
+    Raises:
+        DependencyError: pypandoc-hwpx가 설치되지 않은 경우
+        ConversionError: 변환 실패 시 (나머지 작업이 끝난 뒤 첫 오류를 전파)
+
+    Example:
+        >>> batch_write_hwpx([("# 보고서 1", "r1.hwpx"), ("# 보고서 2", "r2.hwpx")])
+    """
+    in_process = _load_in_process_converter() is not None
+    if not in_process:
+        check_command_exists(Command.PYPANDOC_HWPX, PYPANDOC_INSTALL_HINT)
+    jobs = [(content, ensure_path(output_path)) for content, output_path in items]
+    if not jobs:
+        return []
+    if max_workers is None:
+        max_workers = default_max_workers()
+
+    write = _write_hwpx_in_process if in_process else _write_hwpx
+    logger.info("HWPX 배치 변환 시작: %d개 (워커 %d개)", len(jobs), max_workers)
+    with tempfile.TemporaryDirectory(prefix="hwpparser-hwpx-") as temp_dir:
+        temp_dir_path = Path(temp_dir)
+
+        if max_workers <= 1 or len(jobs) == 1:
+            return [
+                write(content, output_path, content_format, temp_dir=temp_dir_path)
+                for content, output_path in jobs
+            ]
+
+        # 프로세스 안 변환은 XML 생성에 CPU를 쓰므로 프로세스 풀, CLI 실행은 스레드 풀
+        executor_cls = ProcessPoolExecutor if in_process else ThreadPoolExecutor
+        with executor_cls(max_workers=min(max_workers, len(jobs))) as pool:
+            futures = [
+                pool.submit(write, content, output_path, content_format, temp_dir=temp_dir_path)
+                for content, output_path in jobs
+            ]
+            # 모든 작업이 끝날 때까지 기다린 뒤 첫 오류를 전파
+            wait(futures)
+            return [future.result() for future in futures]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_in_process_converter() -> tuple[Callable[[str, str, str], object], str] | None:
+    """pypandoc_hwpx의 변환 함수와 기본 참조 문서 경로를 반환합니다 (없으면 None).
+
+    pypandoc-hwpx CLI가 하는 것과 같이 패키지에 포함된 blank.hwpx를 참조 문서로
+    사용합니다. 설치된 버전의 변환 함수가 기대한 형태(입력, 출력, 참조 문서)가
+    아니거나 blank.hwpx가 없으면 경고를 남기고 None을 반환하여 CLI로 대체합니다.
+    결과는 프로세스마다 한 번만 확인합니다.
+    """
+    try:
+        import pypandoc_hwpx
+        from pypandoc_hwpx.PandocToHwpx import PandocToHwpx
+    except ImportError:
+        logger.debug("pypandoc_hwpx 모듈을 임포트할 수 없습니다.")
+        return None
+
+    import inspect
+
+    convert = getattr(PandocToHwpx, "convert_to_hwpx", None)
+    if not callable(convert):
+        logger.warning("pypandoc_hwpx에 convert_to_hwpx가 없어 CLI로 변환합니다.")
+        return None
+    try:
+        inspect.signature(convert).bind("input", "output", "reference")
+    except TypeError as e:
+        logger.warning("pypandoc_hwpx.convert_to_hwpx 시그니처가 달라 CLI로 변환합니다: %s", e)
+        return None
+    except ValueError:
+        pass  # 시그니처를 알 수 없는 C 함수 등은 호출 시 오류로 확인
+
+    reference_doc = Path(pypandoc_hwpx.__file__).parent / "blank.hwpx"
+    if not reference_doc.is_file():
+        logger.warning("pypandoc_hwpx 참조 문서가 없어 CLI로 변환합니다: %s", reference_doc)
+        return None
+    return convert, str(reference_doc)
+
+
+def _write_hwpx_in_process(
+    content: str | bytes,
+    output_path: Path,
+    content_format: str,
+    *,
+    temp_dir: Path | None = None,
+) -> Path:
+    """콘텐츠를 임시 파일에 기록하고 pypandoc_hwpx 모듈로 직접 변환합니다.
+
+    Raises:
+        DependencyError: pypandoc_hwpx 모듈을 임포트할 수 없는 경우
+        ConversionError: 변환 실패 시
+    """
+    converter = _load_in_process_converter()
+    if converter is None:
+        raise DependencyError("pypandoc-hwpx", PYPANDOC_INSTALL_HINT)
+    convert, reference_doc = converter
+
+    suffix = _CONTENT_SUFFIXES.get(content_format, ".txt")
+    temp_file = create_temp_file(content, suffix=suffix, directory=temp_dir)
+    try:
+        convert(str(temp_file), str(output_path), reference_doc)
+    except Exception as e:
+        raise ConversionError(f"콘텐츠 → HWPX 변환 실패: {e}", content_format, "hwpx") from e
+    finally:
+        temp_file.unlink(missing_ok=True)
+
+    logger.info("HWPX 생성 완료: %s", output_path)
+    return output_path
+
 
+def _write_hwpx(
+    content: str | bytes,
+    output_path: Path,
+    content_format: str,
+    *,
+    temp_dir: Path | None = None,
+) -> Path:
+    """콘텐츠를 임시 파일에 기록하고 pypandoc-hwpx로 변환합니다 (의존성 확인 생략)."""
     # 확장자 결정
-    suffix_map = {"markdown": ".md", "html": ".html"}
-    suffix = suffix_map.get(content_format, ".txt")
+    suffix = _CONTENT_SUFFIXES.get(content_format, ".txt")
 
     # 임시 파일에 콘텐츠 저장
-    temp_file = create_temp_file(content, suffix=suffix)
+    # pypandoc-hwpx는 stdin("-")을 받지 않고 입력 포맷을 확장자로 판단하며,
+    # 같은 입력을 두 번 읽으므로(pandoc 변환 + zip 여부 확인) 파이프로 대체할 수 없음
+    temp_file = create_temp_file(content, suffix=suffix, directory=temp_dir)
 
     logger.info("콘텐츠 → HWPX 변환 시작")
     try:
@@ -149,6 +367,32 @@ def write_hwpx(
     return output_path
 
 
+def file_to_hwpx(input_path: PathLike, output_path: PathLike) -> Path:
+    """마크다운/HTML 파일을 그대로 pypandoc-hwpx에 넘겨 HWPX로 변환합니다.
+
+    내용을 읽거나 임시 파일로 복사하지 않으며, 입력 포맷은 확장자로 결정됩니다.
+    원본 위치가 유지되므로 상대 경로 이미지도 그대로 해석됩니다.
+
+    Args:
+        input_path: 입력 파일 경로 (.md, .markdown, .html, .htm)
+        output_path: 출력 HWPX 파일 경로
+
+    Returns:
+        생성된 HWPX 파일 경로
+    """
+    check_command_exists(Command.PYPANDOC_HWPX, PYPANDOC_INSTALL_HINT)
+    input_path = validate_file_exists(input_path)
+    output_path = ensure_path(output_path)
+
+    logger.info("파일 → HWPX 변환: %s → %s", input_path, output_path)
+    run_command(
+        [Command.PYPANDOC_HWPX, str(input_path), "-o", str(output_path)],
+        error_message=f"파일 → HWPX 변환 실패: {input_path}",
+    )
+    logger.info("HWPX 생성 완료: %s", output_path)
+    return output_path
+
+
 def markdown_to_hwpx(markdown: str, output_path: PathLike) -> Path:
     """마크다운을 HWPX로 변환하는 편의 함수.
 
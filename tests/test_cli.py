@@ -46,3 +46,75 @@ class TestCLI:
         assert result == 0
         captured = capsys.readouterr()
         assert len(captured.out) > 0
+
+    def test_text_glob_no_match(self, tmp_output: Path) -> None:
+        """text 명령어 - 일치하는 파일 없는 glob."""
+        result = main(["text", str(tmp_output / "*.hwp")])
+        assert result == 1
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_convert_glob(self, tmp_output: Path, jobs: str) -> None:
+        """convert 명령어 - glob 입력을 출력 폴더로 변환."""
+        for name in ("a.md", "b.md"):
+            (tmp_output / name).write_text(f"# {name}", encoding="utf-8")
+        output_dir = tmp_output / "out"
+
+        result = main([
+            "convert", str(tmp_output / "*.md"), str(output_dir),
+            "-t", "markdown", "-j", jobs,
+        ])
+
+        assert result == 0
+        assert (output_dir / "a.markdown").read_text(encoding="utf-8") == "# a.md"
+        assert (output_dir / "b.markdown").read_text(encoding="utf-8") == "# b.md"
+
+    def test_convert_glob_requires_format(self, tmp_output: Path) -> None:
+        """convert 명령어 - 여러 파일이면 -t 필수."""
+        for name in ("a.md", "b.md"):
+            (tmp_output / name).write_text("내용", encoding="utf-8")
+
+        result = main(["convert", str(tmp_output / "*.md"), str(tmp_output / "out")])
+        assert result == 1
+
+    @pytest.mark.parametrize("jobs", ["1", "2"])
+    def test_convert_recursive_glob_keeps_subdirs(
+        self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch, jobs: str
+    ) -> None:
+        """convert 명령어 - 같은 이름의 파일이 여러 폴더에 있어도 덮어쓰지 않음."""
+        for sub in ("a", "b"):
+            (tmp_output / "in" / sub).mkdir(parents=True)
+            (tmp_output / "in" / sub / "doc.md").write_text(f"# {sub}", encoding="utf-8")
+        monkeypatch.chdir(tmp_output)
+
+        result = main(["convert", "in/**/*.md", "out", "-t", "markdown", "-j", jobs])
+
+        assert result == 0
+        assert (tmp_output / "out" / "a" / "doc.markdown").read_text(encoding="utf-8") == "# a"
+        assert (tmp_output / "out" / "b" / "doc.markdown").read_text(encoding="utf-8") == "# b"
+
+    def test_convert_glob_duplicate_outputs(self, tmp_output: Path) -> None:
+        """convert 명령어 - 출력 경로가 겹치면 오류."""
+        for name in ("doc.md", "doc.markdown"):
+            (tmp_output / name).write_text("내용", encoding="utf-8")
+
+        result = main(["convert", str(tmp_output / "doc.*"), str(tmp_output / "out"), "-t", "html"])
+
+        assert result == 1
+        assert not (tmp_output / "out").exists()
+
+    def test_convert_glob_reports_unexpected_errors(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """convert 명령어 - HWPParserError가 아닌 실패도 파일별로 보고하고 나머지는 계속."""
+        for name in ("a.md", "b.md"):
+            (tmp_output / name).write_text(f"# {name}", encoding="utf-8")
+
+        def fake_convert(input_path: str, output_path: Path, **_kwargs: object) -> Path:
+            if Path(input_path).stem == "a":
+                raise OSError("디스크 오류")
+            Path(output_path).write_text("ok", encoding="utf-8")
+            return Path(output_path)
+
+        monkeypatch.setattr("hwpparser.converter.convert", fake_convert)
+        result = main(["convert", str(tmp_output / "*.md"), str(tmp_output / "out"), "-t", "html", "-j", "1"])
+
+        assert result == 1
+        assert (tmp_output / "out" / "b.html").exists()
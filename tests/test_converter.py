@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
-from hwpparser import convert, get_supported_conversions
+from hwpparser import aconvert, ahwp_to_pdf, convert, get_supported_conversions
+from hwpparser._cache import ConversionCache, make_cache_key
 from hwpparser.exceptions import HWPFileNotFoundError, UnsupportedFormatError
 
 
@@ -42,6 +44,54 @@ class TestConvert:
         assert isinstance(result, str)
 
 
+class TestIdentityConversion:
+    """같은 포맷 간 변환 테스트."""
+
+    def test_file_is_linked_or_copied(self, tmp_output: Path) -> None:
+        """파일 출력은 같은 내용의 파일 생성."""
+        source = tmp_output / "input.md"
+        source.write_text("# 제목", encoding="utf-8")
+
+        result = convert(source, tmp_output / "output.md")
+
+        assert result == tmp_output / "output.md"
+        assert result.read_text(encoding="utf-8") == "# 제목"
+
+    def test_text_returns_content(self, tmp_output: Path) -> None:
+        """텍스트 출력은 내용 반환."""
+        source = tmp_output / "input.txt"
+        source.write_text("본문", encoding="utf-8")
+
+        assert convert(source, output_format="text") == "본문"
+
+
+class TestAconvert:
+    """aconvert 함수 테스트."""
+
+    def test_file_not_found(self) -> None:
+        """없는 파일 - 동기 버전과 같은 예외."""
+        with pytest.raises(HWPFileNotFoundError):
+            asyncio.run(aconvert("없는파일.hwp", "output.txt"))
+
+    def test_hwp_to_text(self, sample_hwp: Path) -> None:
+        """HWP → 텍스트 변환."""
+        text = asyncio.run(aconvert(sample_hwp, output_format="text"))
+
+        assert isinstance(text, str)
+        assert len(text) > 0
+
+class TestAhwpToPdf:
+    """ahwp_to_pdf 함수 테스트."""
+
+    def test_unknown_backend(self, tmp_output: Path) -> None:
+        """backend 인자를 hwp_to_pdf()에 그대로 전달."""
+        hwp = tmp_output / "doc.hwp"
+        hwp.write_bytes(b"")
+
+        with pytest.raises(UnsupportedFormatError):
+            asyncio.run(ahwp_to_pdf(hwp, tmp_output / "out.pdf", backend="wkhtmltopdf"))
+
+
 class TestGetSupportedConversions:
     """get_supported_conversions 함수 테스트."""
 
@@ -63,3 +113,51 @@ class TestGetSupportedConversions:
         conversions = get_supported_conversions()
 
         assert ("md", "hwpx") in conversions or ("markdown", "hwpx") in conversions
+
+
+class TestConversionCache:
+    """ConversionCache 테스트."""
+
+    def test_key_depends_on_content_and_formats(self, tmp_output: Path) -> None:
+        """키는 입력 내용과 포맷 조합에 따라 달라짐."""
+        a = tmp_output / "a.md"
+        b = tmp_output / "b.md"
+        a.write_text("같은 내용")
+        b.write_text("같은 내용")
+
+        assert make_cache_key(a, "md", "hwpx") == make_cache_key(b, "md", "hwpx")
+        assert make_cache_key(a, "md", "hwpx") != make_cache_key(a, "markdown", "hwpx")
+
+        b.write_text("다른 내용")
+        assert make_cache_key(a, "md", "hwpx") != make_cache_key(b, "md", "hwpx")
+
+    def test_text_roundtrip(self, tmp_output: Path) -> None:
+        """텍스트 결과 저장/조회."""
+        cache = ConversionCache(tmp_output / "cache")
+
+        assert cache.get("deadbeef") is None
+        cache.put("deadbeef", "본문 텍스트")
+        assert cache.get("deadbeef") == "본문 텍스트"
+
+    def test_file_roundtrip(self, tmp_output: Path) -> None:
+        """파일 결과 저장/조회."""
+        cache = ConversionCache(tmp_output / "cache")
+        produced = tmp_output / "out.pdf"
+        produced.write_bytes(b"%PDF-1.4")
+
+        cache.put("cafe", produced)
+        cached = cache.get("cafe")
+
+        assert isinstance(cached, Path)
+        assert cached.suffix == ".pdf"
+        assert cached.read_bytes() == b"%PDF-1.4"
+
+    def test_put_replaces_atomically(self, tmp_output: Path) -> None:
+        """임시 파일 없이 결과와 메타데이터가 교체되고, 다시 저장하면 새 결과로 바뀜."""
+        cache = ConversionCache(tmp_output / "cache")
+
+        cache.put("beef", "이전")
+        cache.put("beef", "이후")
+
+        assert cache.get("beef") == "이후"
+        assert sorted(p.name for p in (tmp_output / "cache").iterdir()) == ["beef.json", "beef.txt"]
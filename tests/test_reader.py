@@ -6,8 +6,10 @@ from pathlib import Path
 
 import pytest
 
-from hwpparser import HWPReader, hwp_to_text, read_hwp
-from hwpparser.exceptions import HWPFileNotFoundError
+from hwpparser import HWPDocument, HWPReader, hwp_to_pdf, hwp_to_text, read_hwp
+from hwpparser._chrome_pool import ChromeWorker
+from hwpparser.exceptions import ConversionError, HWPFileNotFoundError, UnsupportedFormatError
+from hwpparser.reader import _html_to_rich_text
 
 
 class TestHWPReader:
@@ -58,6 +60,54 @@ class TestHWPReader:
         assert "HWPReader" in repr_str
         assert str(sample_hwp) in repr_str
 
+    def test_html_conversion_shared(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """html, rich_text, to_pdf가 hwp5html 결과 하나를 공유."""
+        from hwpparser import reader as reader_module
+
+        calls: list[Path] = []
+
+        def fake_html(path: Path, output_dir: Path) -> Path:
+            calls.append(path)
+            html_file = output_dir / "index.xhtml"
+            html_file.write_text("<html><body><p>본문</p></body></html>", encoding="utf-8")
+            return html_file
+
+        def fake_render(html_file: Path, output_path: Path, *args: object, **kwargs: object) -> None:
+            output_path.write_bytes(html_file.read_bytes())
+
+        monkeypatch.setattr(reader_module, "_hwp_to_html_dir", fake_html)
+        monkeypatch.setattr(reader_module, "_render_pdf", fake_render)
+        hwp = tmp_output / "doc.hwp"
+        hwp.write_bytes(b"")
+
+        with HWPReader(hwp) as reader:
+            assert reader.rich_text == "본문"
+            assert "본문" in reader.html
+            reader.to_pdf(tmp_output / "out.pdf", backend="weasyprint")
+            html_dir = reader._html_file.parent
+
+        assert len(calls) == 1
+        assert not html_dir.exists()
+
+
+class TestHWPDocument:
+    """HWPDocument 데이터 클래스 테스트."""
+
+    def test_len_and_repr(self) -> None:
+        """len()은 텍스트 길이, repr에 길이 표시."""
+        doc = HWPDocument(path=Path("doc.hwp"), text="본문 텍스트")
+
+        assert len(doc) == 6
+        assert "text_length=6" in repr(doc)
+
+    def test_empty_document_is_truthy(self) -> None:
+        """본문이 비어 있어도 문서 객체는 참으로 평가됨."""
+        doc = HWPDocument(path=Path("empty.hwp"))
+
+        assert len(doc) == 0
+        assert doc
+        assert (doc or None) is doc
+
 
 class TestHwpToText:
     """hwp_to_text 함수 테스트."""
@@ -86,3 +136,173 @@ class TestReadHwp:
 
         assert isinstance(reader, HWPReader)
         assert reader.path == sample_hwp
+
+
+class TestChromeWorker:
+    """ChromeWorker 클래스 테스트."""
+
+    def test_render_requires_start(self, tmp_output: Path) -> None:
+        """시작하지 않은 워커로 인쇄 시 오류."""
+        worker = ChromeWorker("chrome")
+
+        with pytest.raises(ConversionError):
+            worker.render_html_to_pdf(tmp_output / "index.html", tmp_output / "out.pdf")
+
+    def test_connection_error_closes_worker(self, tmp_output: Path) -> None:
+        """인쇄 중 연결이 끊기면 ConversionError로 감싸고 워커를 종료."""
+
+        class BrokenSocket:
+            def send(self, _message: str) -> None:
+                pass
+
+            def recv(self) -> str:
+                raise ConnectionResetError("연결 끊김")
+
+            def settimeout(self, _timeout: float) -> None:
+                pass
+
+            def close(self) -> None:
+                pass
+
+        worker = ChromeWorker("chrome")
+        worker._ws = BrokenSocket()
+
+        with pytest.raises(ConversionError, match="연결 끊김"):
+            worker.render_html_to_pdf(tmp_output / "index.html", tmp_output / "out.pdf")
+        assert "running=False" in repr(worker)
+
+    def test_render_timeout_closes_worker(self, tmp_output: Path) -> None:
+        """응답이 마감 시간 안에 오지 않으면 ConversionError로 감싸고 워커를 종료."""
+        timeouts: list[float] = []
+
+        class SilentSocket:
+            def send(self, _message: str) -> None:
+                pass
+
+            def recv(self) -> str:
+                raise TimeoutError("timed out")
+
+            def settimeout(self, timeout: float) -> None:
+                timeouts.append(timeout)
+
+            def close(self) -> None:
+                pass
+
+        worker = ChromeWorker("chrome")
+        worker._ws = SilentSocket()
+
+        with pytest.raises(ConversionError, match="timed out"):
+            worker.render_html_to_pdf(tmp_output / "index.html", tmp_output / "out.pdf", timeout=5.0)
+        assert 0 < timeouts[0] <= 5.0
+        assert "running=False" in repr(worker)
+
+    def test_active_worker_is_context_local(self) -> None:
+        """with 블록으로 연 워커는 다른 스레드의 기본값이 되지 않음."""
+        import threading
+
+        from hwpparser._chrome_pool import active_worker, use_worker
+
+        worker = ChromeWorker("chrome")
+        seen: list[object] = []
+
+        with use_worker(worker):
+            assert active_worker() is worker
+            thread = threading.Thread(target=lambda: seen.append(active_worker()))
+            thread.start()
+            thread.join()
+
+        assert seen == [None]
+        assert active_worker() is None
+
+    def test_render_falls_back_to_one_shot(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """워커 인쇄가 실패하면 일회성 Chrome 실행으로 재시도."""
+        from hwpparser import reader
+
+        commands: list[list[str]] = []
+
+        def fake_run_command(args: list[str], **_kwargs: object) -> str:
+            commands.append(args)
+            (tmp_output / "out.pdf").write_bytes(b"%PDF")
+            return ""
+
+        monkeypatch.setattr(reader, "run_command", fake_run_command)
+        worker = ChromeWorker("chrome")
+
+        reader._render_pdf(tmp_output / "index.html", tmp_output / "out.pdf", "chrome", worker, None)
+
+        assert commands[0][0] == "chrome"
+        assert (tmp_output / "out.pdf").exists()
+
+
+class TestHtmlToRichText:
+    """_html_to_rich_text 함수 테스트."""
+
+    def test_tables_and_tail_text(self) -> None:
+        """표는 마크다운으로, 표 뒤 텍스트와 문단은 순서대로 유지."""
+        html = (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml"><body>'
+            "<p>첫 문단\r</p><!-- 주석 -->"
+            '<table><tr><th>이름</th><th>값</th></tr><tr><td colspan="2">합계</td></tr></table>'
+            "꼬리<p>끝</p></body></html>"
+        )
+
+        assert _html_to_rich_text(html) == (
+            "첫 문단\n\n| 이름 | 값 |\n|---|---|\n| 합계 |   |\n\n꼬리\n끝"
+        )
+
+    def test_empty_table_does_not_shift_placeholders(self) -> None:
+        """빈 표가 있어도 뒤 표의 위치가 어긋나지 않음."""
+        html = "<html><body><table></table><p>a</p><table><tr><td>x</td></tr></table></body></html>"
+
+        assert _html_to_rich_text(html) == "a\n\n| x |\n|---|"
+
+    def test_empty_input(self) -> None:
+        """빈 입력은 빈 문자열."""
+        assert _html_to_rich_text("") == ""
+
+
+class TestHwpToPdf:
+    """hwp_to_pdf 함수 테스트."""
+
+    def test_unknown_backend(self, tmp_output: Path) -> None:
+        """알 수 없는 백엔드는 UnsupportedFormatError."""
+        hwp = tmp_output / "doc.hwp"
+        hwp.write_bytes(b"")
+
+        with pytest.raises(UnsupportedFormatError):
+            hwp_to_pdf(hwp, tmp_output / "out.pdf", backend="wkhtmltopdf")
+
+
+class TestHwpBatchToPdf:
+    """hwp_batch_to_pdf 함수 테스트."""
+
+    def test_pipeline_order_and_errors(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """HTML/PDF 단계를 거쳐 입력 순서대로 반환하고, 실패는 전파."""
+        from hwpparser import reader
+
+        def fake_html(path: Path, output_dir: Path) -> Path:
+            if path.stem == "bad":
+                raise ConversionError("HWP → HTML 변환 실패")
+            html_file = output_dir / "index.xhtml"
+            html_file.write_text(path.stem)
+            return html_file
+
+        def fake_render(html_file: Path, output_path: Path, *args: object, **kwargs: object) -> None:
+            output_path.write_text(html_file.read_text())
+
+        monkeypatch.setattr(reader, "_hwp_to_html_dir", fake_html)
+        monkeypatch.setattr(reader, "_render_pdf", fake_render)
+
+        items = []
+        for name in ("a", "b", "c"):
+            (tmp_output / f"{name}.hwp").write_bytes(b"")
+            items.append((tmp_output / f"{name}.hwp", tmp_output / f"{name}.pdf"))
+
+        outputs = reader.hwp_batch_to_pdf(items, backend="weasyprint")
+        assert outputs == [dst for _src, dst in items]
+        assert [p.read_text() for p in outputs] == ["a", "b", "c"]
+
+        (tmp_output / "bad.hwp").write_bytes(b"")
+        with pytest.raises(ConversionError):
+            reader.hwp_batch_to_pdf(items + [(tmp_output / "bad.hwp", tmp_output / "bad.pdf")], backend="weasyprint")
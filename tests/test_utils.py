@@ -0,0 +1,99 @@
+"""Utils 모듈 테스트."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import pytest
+
+from hwpparser.exceptions import ConversionError, DependencyError
+from hwpparser.utils import (
+    _spawn_argv,
+    check_command_exists,
+    clear_path_cache,
+    decode_output,
+    run_command,
+    run_command_streaming,
+)
+
+
+class TestDecodeOutput:
+    """decode_output 함수 테스트."""
+
+    def test_matches_text_mode(self) -> None:
+        """CRLF/CR을 텍스트 모드(universal newlines)처럼 LF로 변환."""
+        script = "import sys; sys.stdout.buffer.write('가\\r\\n나\\r다\\n'.encode('utf-8'))"
+
+        assert decode_output(run_command([sys.executable, "-c", script]).stdout) == "가\n나\n다\n"
+
+
+class TestRunCommandStreaming:
+    """run_command_streaming 함수 테스트."""
+
+    def test_multibyte_across_chunks(self) -> None:
+        """조각 경계에서 잘린 한글도 올바르게 디코딩."""
+        script = "import sys; sys.stdout.buffer.write('한글 텍스트\\n'.encode('utf-8'))"
+
+        chunks = list(run_command_streaming([sys.executable, "-c", script], chunk_size=2))
+
+        assert "".join(chunks) == "한글 텍스트\n"
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 3])
+    def test_crlf_across_chunks(self, chunk_size: int) -> None:
+        """조각 경계에서 잘린 CRLF도 hwp_to_text와 같이 LF 하나로 변환."""
+        script = "import sys; sys.stdout.buffer.write('가\\r\\n나\\r\\n\\r다\\r'.encode('utf-8'))"
+
+        chunks = list(run_command_streaming([sys.executable, "-c", script], chunk_size=chunk_size))
+
+        assert "".join(chunks) == "가\n나\n\n다\n"
+
+    def test_failure_raises(self) -> None:
+        """0이 아닌 종료 코드는 ConversionError."""
+        script = "import sys; sys.stderr.write('boom'); sys.exit(3)"
+
+        with pytest.raises(ConversionError, match="boom"):
+            list(run_command_streaming([sys.executable, "-c", script]))
+
+    def test_missing_command(self) -> None:
+        """없는 명령어는 DependencyError."""
+        with pytest.raises(DependencyError):
+            list(run_command_streaming(["hwpparser-no-such-command"]))
+
+
+class TestCheckCommandExists:
+    """check_command_exists 함수 테스트."""
+
+    def test_result_cached_until_cleared(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """PATH 조회는 캐시되고 clear_path_cache()로 초기화."""
+        calls: list[str] = []
+
+        def fake_which(command: str) -> str:
+            calls.append(command)
+            return f"/usr/bin/{command}"
+
+        clear_path_cache()
+        monkeypatch.setattr("hwpparser.utils.shutil.which", fake_which)
+        try:
+            check_command_exists("hwp5txt")
+            check_command_exists("hwp5txt")
+            assert calls == ["hwp5txt"]
+
+            clear_path_cache()
+            check_command_exists("hwp5txt")
+            assert calls == ["hwp5txt", "hwp5txt"]
+        finally:
+            clear_path_cache()
+
+    def test_missing_command(self) -> None:
+        """없는 명령어는 DependencyError."""
+        with pytest.raises(DependencyError):
+            check_command_exists("hwpparser-no-such-command")
+
+    def test_spawn_argv_resolves_executable(self) -> None:
+        """명령어 이름은 절대 경로로 바뀌고, 못 찾으면 그대로 유지."""
+        argv = _spawn_argv(["sh", "-c", "true"])
+
+        assert Path(argv[0]).is_absolute()
+        assert argv[1:] == ["-c", "true"]
+        assert _spawn_argv(["hwpparser-no-such-command"]) == ["hwpparser-no-such-command"]
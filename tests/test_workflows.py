@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 import pytest
 
+from hwpparser._cache import TextManifest
+from hwpparser.exceptions import HWPFileNotFoundError, HWPParserError
 from hwpparser.workflows import (
     BatchResult,
     DirectoryHWPLoader,
     Document,
     HWPLoader,
     TextChunk,
+    _compile_name_pattern,
+    _hwp_to_text_cached,
+    _iter_hwp_files,
+    _text_cache_scope,
+    batch_convert,
     batch_extract_text,
     chunk_text,
+    export_to_jsonl,
     extract_metadata,
+    hwp_batch_to_chunks,
     hwp_to_chunks,
 )
 
@@ -44,6 +54,17 @@ class TestChunkText:
         assert "start" in chunks[0].metadata
         assert "end" in chunks[0].metadata
 
+    def test_chunk_offsets_match_source(self) -> None:
+        """start/end는 원문에서 청크 위치 (오버랩 포함)."""
+        text = "A" * 500 + "\n\n" + "B" * 500 + "\n\n" + "C" * 500
+        chunks = chunk_text(text, chunk_size=600, chunk_overlap=100)
+
+        assert len(chunks) == 3
+        for chunk in chunks:
+            assert text[chunk.metadata["start"]:chunk.metadata["end"]] == chunk.text
+        assert chunks[1].metadata["start"] == 400
+        assert chunks[-1].metadata["end"] == len(text)
+
 
 class TestHwpToChunks:
     """hwp_to_chunks 함수 테스트."""
@@ -57,6 +78,43 @@ class TestHwpToChunks:
         assert all(c.metadata.get("source_type") == "hwp" for c in chunks)
 
 
+class TestHwpBatchToChunks:
+    """hwp_batch_to_chunks 함수 테스트."""
+
+    def test_empty_paths(self) -> None:
+        """입력이 없으면 빈 리스트."""
+        assert hwp_batch_to_chunks([]) == []
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_missing_file_raises(self, tmp_output: Path, max_workers: int) -> None:
+        """없는 파일이 있으면 예외 전파."""
+        paths = [tmp_output / "a.hwp", tmp_output / "b.hwp"]
+
+        with pytest.raises(HWPFileNotFoundError):
+            hwp_batch_to_chunks(paths, max_workers=max_workers)
+
+    def test_batch_chunking(self, sample_hwp: Path) -> None:
+        """파일 순서대로 청크 반환."""
+        results = hwp_batch_to_chunks([sample_hwp, sample_hwp], chunk_size=200, max_workers=2)
+
+        assert len(results) == 2
+        assert results[0] and results[0][0].metadata["source"] == str(sample_hwp)
+
+    def test_thread_fallback(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """프로세스를 만들 수 없으면 스레드로 처리하고 순서는 유지."""
+
+        def no_processes(*_args: object, **_kwargs: object) -> None:
+            raise NotImplementedError("프로세스 생성 불가")
+
+        monkeypatch.setattr("concurrent.futures.ProcessPoolExecutor", no_processes)
+        monkeypatch.setattr("hwpparser.workflows._read_hwp_text", lambda path, *_args: f"본문 {path.stem}")
+        paths = [tmp_output / f"{name}.hwp" for name in "abc"]
+
+        results = hwp_batch_to_chunks(paths, max_workers=2)
+
+        assert [chunks[0].text for chunks in results] == ["본문 a", "본문 b", "본문 c"]
+
+
 class TestHWPLoader:
     """HWPLoader 클래스 테스트."""
 
@@ -77,6 +135,21 @@ class TestHWPLoader:
         docs = list(loader.lazy_load())
         assert len(docs) == 1
 
+    def test_prefetch_preserves_order(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """prefetch 사용 시에도 입력 순서를 유지하고 실패한 파일은 건너뜀."""
+        paths = [tmp_path / f"{i}.hwp" for i in range(6)]
+
+        def fake_hwp_to_text(path: Path) -> str:
+            if path.stem == "3":
+                raise HWPParserError("broken")
+            return path.stem
+
+        monkeypatch.setattr("hwpparser.workflows.hwp_to_text", fake_hwp_to_text)
+        loader = HWPLoader(paths, prefetch=2)
+
+        assert [doc.page_content for doc in loader.lazy_load()] == ["0", "1", "2", "4", "5"]
+        assert len(loader.load()) == 5
+
 
 class TestDirectoryHWPLoader:
     """DirectoryHWPLoader 클래스 테스트."""
@@ -89,6 +162,52 @@ class TestDirectoryHWPLoader:
         assert len(docs) >= 1
 
 
+class TestIterHwpFiles:
+    """_iter_hwp_files 함수 테스트."""
+
+    def test_recursive_and_flat(self, tmp_output: Path) -> None:
+        """패턴과 일치하는 파일만, recursive일 때 하위 폴더까지."""
+        (tmp_output / "sub" / "deep").mkdir(parents=True)
+        (tmp_output / "dir.hwp").mkdir()
+        for name in ("a.hwp", "b.txt", "sub/c.hwp", "sub/deep/d.hwp"):
+            (tmp_output / name).write_bytes(b"")
+
+        flat = sorted(p.name for p in _iter_hwp_files(tmp_output, "*.hwp", False))
+        deep = sorted(p.name for p in _iter_hwp_files(tmp_output, "*.hwp", True))
+
+        assert flat == ["a.hwp"]
+        assert deep == ["a.hwp", "c.hwp", "d.hwp"]
+
+    def test_missing_directory(self, tmp_output: Path) -> None:
+        """없는 디렉토리는 빈 결과."""
+        assert list(_iter_hwp_files(tmp_output / "없음", "*.hwp", True)) == []
+
+    def test_parallel_matches_serial(self, tmp_output: Path) -> None:
+        """병렬 순회도 순차 순회와 같은 파일을 찾음."""
+        for a in range(3):
+            for b in range(3):
+                directory = tmp_output / str(a) / str(b)
+                directory.mkdir(parents=True)
+                (directory / "x.hwp").write_bytes(b"")
+                (directory / "x.txt").write_bytes(b"")
+
+        serial = sorted(_iter_hwp_files(tmp_output, "*.hwp", True))
+        parallel = sorted(_iter_hwp_files(tmp_output, "*.hwp", True, workers=4))
+
+        assert len(serial) == 9
+        assert parallel == serial
+
+    def test_compiled_pattern(self, tmp_output: Path) -> None:
+        """미리 컴파일한 패턴도 문자열 패턴과 같은 결과."""
+        for name in ("a.hwp", "ab.hwp", "b.hwp", "a.hwpx"):
+            (tmp_output / name).write_bytes(b"")
+
+        compiled = _compile_name_pattern("a*.hwp")
+        assert compiled is not None
+        assert sorted(p.name for p in _iter_hwp_files(tmp_output, compiled, False)) == ["a.hwp", "ab.hwp"]
+        assert _compile_name_pattern("sub/*.hwp") is None
+
+
 class TestExtractMetadata:
     """extract_metadata 함수 테스트."""
 
@@ -103,6 +222,102 @@ class TestExtractMetadata:
         assert "word_count" in meta
         assert meta["char_count"] > 0
 
+    def test_metadata_from_given_text(self, tmp_output: Path) -> None:
+        """텍스트를 주면 파싱 없이 그 텍스트로 계산."""
+        hwp = tmp_output / "doc.hwp"
+        hwp.write_bytes(b"1234")
+
+        meta = extract_metadata(hwp, text="첫 줄 단어\n둘째 줄")
+
+        assert meta["file_size"] == 4
+        assert meta["char_count"] == 11
+        assert meta["word_count"] == 5
+        assert meta["line_count"] == 2
+        assert meta["modified_time"] == hwp.stat().st_mtime
+
+    def test_metadata_from_given_stat(self, tmp_output: Path) -> None:
+        """stat 결과를 주면 파일을 다시 stat하지 않고 그 값을 사용."""
+        hwp = tmp_output / "doc.hwp"
+        hwp.write_bytes(b"1234")
+        stat_result = hwp.stat()
+        hwp.write_bytes(b"123456789")
+
+        meta = extract_metadata(hwp, text="본문", stat_result=stat_result)
+
+        assert meta["file_size"] == 4
+
+
+class TestTextCache:
+    """추출 텍스트 캐시 테스트."""
+
+    def test_reuses_text_until_file_changes(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """한 번의 로드 안에서 같은 파일은 한 번만 파싱하고, 파일이 바뀌면 다시 파싱."""
+        hwp = tmp_output / "doc.hwp"
+        hwp.write_bytes(b"1234")
+        calls: list[Path] = []
+
+        def fake_hwp_to_text(path: Path) -> str:
+            calls.append(path)
+            return f"본문 {len(calls)}"
+
+        monkeypatch.setattr("hwpparser.workflows.hwp_to_text", fake_hwp_to_text)
+
+        docs = HWPLoader([hwp, hwp]).load()
+        assert len(calls) == 1
+        assert [doc.page_content for doc in docs] == ["본문 1", "본문 1"]
+
+        with _text_cache_scope():
+            assert extract_metadata(hwp)["char_count"] == len("본문 2")
+            hwp.write_bytes(b"123456")
+            assert extract_metadata(hwp)["char_count"] == len("본문 3")
+        assert len(calls) == 3
+
+    def test_cleared_after_batch(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """배치가 끝나면 캐시가 비고, 배치 밖의 호출은 캐시에 남지 않음."""
+        (tmp_output / "a.hwp").write_bytes(b"")
+        monkeypatch.setattr("hwpparser.workflows.hwp_to_text", lambda path: f"본문 {path.stem}")
+
+        batch_extract_text(tmp_output, max_workers=1)
+        export_to_jsonl(tmp_output, tmp_output / "out.jsonl")
+        hwp_to_chunks(tmp_output / "a.hwp")
+
+        assert _hwp_to_text_cached.cache_info().currsize == 0
+
+
+class TestTextManifest:
+    """디스크 텍스트 매니페스트 테스트."""
+
+    def test_reuses_text_across_runs(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """두 번째 실행은 바뀌지 않은 파일을 다시 파싱하지 않음."""
+        input_dir = tmp_output / "in"
+        input_dir.mkdir()
+        for name in ("a.hwp", "b.hwp"):
+            (input_dir / name).write_bytes(name.encode())
+        calls: list[str] = []
+
+        def fake_hwp_to_text(path: Path) -> str:
+            calls.append(path.name)
+            return f"본문 {path.stem}"
+
+        monkeypatch.setattr("hwpparser.workflows.hwp_to_text", fake_hwp_to_text)
+        cache_path = tmp_output / "manifest.pickle"
+
+        first = batch_extract_text(input_dir, cache_path=cache_path, max_workers=1)
+        (input_dir / "b.hwp").write_bytes(b"changed")
+        count = export_to_jsonl(input_dir, tmp_output / "out.jsonl", cache_path=cache_path)
+
+        assert cache_path.exists()
+        assert "본문 a" in first
+        assert count == 2
+        assert sorted(calls) == ["a.hwp", "b.hwp", "b.hwp"]
+
+    def test_corrupt_manifest_is_ignored(self, tmp_output: Path) -> None:
+        """읽을 수 없는 매니페스트는 빈 매니페스트로 대체."""
+        cache_path = tmp_output / "manifest.pickle"
+        cache_path.write_bytes(b"not a pickle")
+
+        assert len(TextManifest.load(cache_path)) == 0
+
 
 class TestBatchResult:
     """BatchResult 클래스 테스트."""
@@ -116,3 +331,132 @@ class TestBatchResult:
         """빈 결과."""
         result = BatchResult()
         assert result.success_rate == 0.0
+
+
+class TestBatchConvert:
+    """batch_convert 함수 테스트."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_failures_are_collected(self, tmp_output: Path, max_workers: int) -> None:
+        """변환 실패가 워커 수와 관계없이 집계됨."""
+        input_dir = tmp_output / "in"
+        input_dir.mkdir()
+        for name in ("a.hwp", "b.hwp"):
+            (input_dir / name).write_bytes(b"not an hwp file")
+
+        progress: list[int] = []
+        result = batch_convert(
+            input_dir,
+            tmp_output / "out",
+            "txt",
+            max_workers=max_workers,
+            on_progress=lambda _path, done, _total: progress.append(done),
+        )
+
+        assert result.total == 2
+        assert result.failed == 2
+        assert set(result.errors) == {str(input_dir / "a.hwp"), str(input_dir / "b.hwp")}
+        assert progress == [1, 2]
+
+
+class TestBatchExtractText:
+    """batch_extract_text 함수 테스트."""
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_output_file_matches_return(
+        self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch, max_workers: int
+    ) -> None:
+        """파일에 기록한 내용이 반환 문자열과 같고, 실패한 파일은 빠짐."""
+        input_dir = tmp_output / "in"
+        input_dir.mkdir()
+        for name in ("a.hwp", "b.hwp", "c.hwp"):
+            (input_dir / name).write_bytes(b"")
+
+        def fake_read_hwp_text(path: Path, *_args: object, **_kwargs: object) -> str:
+            if path.stem == "b":
+                raise HWPParserError("broken")
+            return f"본문 {path.stem}"
+
+        monkeypatch.setattr("hwpparser.workflows._read_hwp_text", fake_read_hwp_text)
+        output_file = tmp_output / "all.txt"
+
+        combined = batch_extract_text(input_dir, output_file, separator="\n--\n", max_workers=max_workers)
+
+        assert combined == "# a.hwp\n\n본문 a\n--\n# c.hwp\n\n본문 c"
+        assert output_file.read_text(encoding="utf-8") == combined
+
+        streamed = batch_extract_text(
+            input_dir, output_file, separator="\n--\n", max_workers=max_workers, return_text=False
+        )
+
+        assert streamed == ""
+        assert output_file.read_text(encoding="utf-8") == combined
+
+    def test_return_text_requires_output_file(self, tmp_output: Path) -> None:
+        """return_text=False는 output_file 없이 사용할 수 없음."""
+        with pytest.raises(ValueError):
+            batch_extract_text(tmp_output, return_text=False)
+
+    def test_unsorted(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """sort=False면 순서와 관계없이 모든 파일을 합침."""
+        for name in ("a.hwp", "b.hwp", "c.hwp"):
+            (tmp_output / name).write_bytes(b"")
+        monkeypatch.setattr(
+            "hwpparser.workflows._read_hwp_text",
+            lambda path, *_args, **_kwargs: f"본문 {path.stem}",
+        )
+
+        combined = batch_extract_text(tmp_output, separator="|", max_workers=2, sort=False)
+
+        assert sorted(combined.split("|")) == [f"# {s}.hwp\n\n본문 {s}" for s in "abc"]
+
+    def test_parallel_scan_is_opt_in(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """기본은 순차 순회이고, scan_workers를 주면 병렬 순회로 같은 결과."""
+        for sub in ("x", "y", "z"):
+            (tmp_output / sub).mkdir()
+            (tmp_output / sub / f"{sub}.hwp").write_bytes(b"")
+        monkeypatch.setattr(
+            "hwpparser.workflows._read_hwp_text",
+            lambda path, *_args, **_kwargs: f"본문 {path.stem}",
+        )
+        scans: list[int] = []
+        original = _iter_hwp_files
+
+        def spy(*args: object, workers: int = 1) -> object:
+            scans.append(workers)
+            return original(*args, workers=workers)  # type: ignore[arg-type]
+
+        monkeypatch.setattr("hwpparser.workflows._iter_hwp_files", spy)
+
+        serial = batch_extract_text(tmp_output, recursive=True, max_workers=1)
+        parallel = batch_extract_text(tmp_output, recursive=True, max_workers=1, scan_workers=4)
+
+        assert scans == [1, 4]
+        assert serial == parallel
+
+
+class TestExportToJsonl:
+    """export_to_jsonl 함수 테스트."""
+
+    def test_parses_each_file_once(self, tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """파일당 한 번만 텍스트를 추출하고 청크별 레코드 기록."""
+        calls: list[Path] = []
+
+        def fake_hwp_to_text(path: Path) -> str:
+            calls.append(path)
+            return "가" * 30 + "\n\n" + "나" * 30
+
+        monkeypatch.setattr("hwpparser.workflows.hwp_to_text", fake_hwp_to_text)
+        input_dir = tmp_output / "in"
+        input_dir.mkdir()
+        (input_dir / "a.hwp").write_bytes(b"")
+        output = tmp_output / "out.jsonl"
+
+        count = export_to_jsonl(input_dir, output, chunk_size=40)
+
+        records = [json.loads(line) for line in output.read_text(encoding="utf-8").splitlines()]
+        assert count == 2
+        assert len(calls) == 1
+        assert [r["chunk_index"] for r in records] == [0, 1]
+        assert records[0]["char_count"] == 62
+        assert records[0]["file_name"] == "a.hwp"
@@ -0,0 +1,146 @@
+"""Writer 모듈 테스트."""
+
+from __future__ import annotations
+
+import inspect
+import sys
+import types
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from hwpparser.exceptions import ConversionError
+from hwpparser.writer import BatchHWPXWriter, _load_in_process_converter, batch_write_hwpx
+
+
+@pytest.fixture(autouse=True)
+def _clear_converter_cache() -> Iterator[None]:
+    """테스트마다 pypandoc_hwpx 모듈 확인 결과를 새로 계산."""
+    _load_in_process_converter.cache_clear()
+    yield
+    _load_in_process_converter.cache_clear()
+
+
+@pytest.fixture
+def fake_pypandoc_hwpx(tmp_output: Path, monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str, str]]:
+    """pypandoc_hwpx 모듈 대신 입력 파일 내용을 출력으로 복사하는 가짜 모듈 (CLI 호출 금지)."""
+    calls: list[tuple[str, str, str]] = []
+
+    def fake_convert(input_path: str, output_path: str, reference_path: str) -> None:
+        calls.append((input_path, output_path, reference_path))
+        Path(output_path).write_bytes(Path(input_path).read_bytes())
+
+    package_dir = tmp_output / "pypandoc_hwpx"
+    package_dir.mkdir()
+    (package_dir / "blank.hwpx").write_bytes(b"")
+    package = types.ModuleType("pypandoc_hwpx")
+    package.__file__ = str(package_dir / "__init__.py")
+    module = types.ModuleType("pypandoc_hwpx.PandocToHwpx")
+    module.PandocToHwpx = types.SimpleNamespace(convert_to_hwpx=fake_convert)  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "pypandoc_hwpx", package)
+    monkeypatch.setitem(sys.modules, "pypandoc_hwpx.PandocToHwpx", module)
+    monkeypatch.setattr("hwpparser.writer.run_command", lambda *_args, **_kwargs: pytest.fail("CLI 호출됨"))
+    return calls
+
+
+class TestBatchWriteHwpx:
+    """batch_write_hwpx 함수 테스트."""
+
+    @pytest.fixture
+    def fake_pandoc(self, monkeypatch: pytest.MonkeyPatch) -> list[Path]:
+        """pypandoc-hwpx 실행 대신 입력 파일 내용을 출력으로 복사."""
+        inputs: list[Path] = []
+
+        def fake_run_command(args: list[str], **_kwargs: object) -> str:
+            source, output = Path(args[1]), Path(args[3])
+            inputs.append(source)
+            if b"fail" in source.read_bytes():
+                raise ConversionError("변환 실패")
+            output.write_bytes(source.read_bytes())
+            return ""
+
+        monkeypatch.setattr("hwpparser.writer.check_command_exists", lambda *_args: None)
+        monkeypatch.setattr("hwpparser.writer.run_command", fake_run_command)
+        return inputs
+
+    @pytest.mark.parametrize("max_workers", [1, 3])
+    def test_writes_in_order(self, tmp_output: Path, fake_pandoc: list[Path], max_workers: int) -> None:
+        """입력 순서대로 결과를 반환하고 중간 파일은 공유 디렉토리에서 정리됨."""
+        items = [(f"# 문서 {i}", tmp_output / f"{i}.hwpx") for i in range(4)]
+
+        outputs = batch_write_hwpx(items, max_workers=max_workers)
+
+        assert outputs == [output for _content, output in items]
+        assert [p.read_text(encoding="utf-8") for p in outputs] == [content for content, _output in items]
+        assert len({p.parent for p in fake_pandoc}) == 1
+        assert not fake_pandoc[0].parent.exists()
+
+    def test_first_error_propagates(self, tmp_output: Path, fake_pandoc: list[Path]) -> None:
+        """실패가 있으면 나머지를 마친 뒤 예외 전파."""
+        items = [("ok", tmp_output / "a.hwpx"), ("fail", tmp_output / "b.hwpx"), ("ok", tmp_output / "c.hwpx")]
+
+        with pytest.raises(ConversionError):
+            batch_write_hwpx(items, max_workers=3)
+
+        assert (tmp_output / "c.hwpx").exists()
+
+    def test_in_process(self, tmp_output: Path, fake_pypandoc_hwpx: list[tuple[str, str, str]]) -> None:
+        """pypandoc_hwpx 모듈이 있으면 CLI 대신 모듈로 변환."""
+        items = [(f"# 문서 {i}", tmp_output / f"{i}.hwpx") for i in range(3)]
+
+        outputs = batch_write_hwpx(items, max_workers=1)
+
+        assert [p.read_text(encoding="utf-8") for p in outputs] == [content for content, _output in items]
+        assert len(fake_pypandoc_hwpx) == 3
+
+
+class TestBatchHWPXWriter:
+    """BatchHWPXWriter 클래스 테스트."""
+
+    def test_in_process_conversion(
+        self, tmp_output: Path, fake_pypandoc_hwpx: list[tuple[str, str, str]]
+    ) -> None:
+        """pypandoc_hwpx 모듈이 있으면 CLI 없이 프로세스 안에서 변환."""
+        calls = fake_pypandoc_hwpx
+
+        with BatchHWPXWriter() as writer:
+            first = writer.write("# 하나", tmp_output / "1.hwpx")
+            second = writer.write("<p>둘</p>", tmp_output / "2.hwpx", "html")
+
+        assert first.read_text(encoding="utf-8") == "# 하나"
+        assert second.read_text(encoding="utf-8") == "<p>둘</p>"
+        assert [Path(c[0]).suffix for c in calls] == [".md", ".html"]
+        assert calls[0][2].endswith("blank.hwpx")
+        assert not Path(calls[0][0]).parent.exists()
+
+    def test_requires_with_block(self, tmp_output: Path) -> None:
+        """with 블록 밖에서 호출하면 ConversionError."""
+        with pytest.raises(ConversionError):
+            BatchHWPXWriter().write("# 제목", tmp_output / "out.hwpx")
+
+
+class TestLoadInProcessConverter:
+    """_load_in_process_converter 함수 테스트."""
+
+    def test_signature_mismatch_falls_back(
+        self, fake_pypandoc_hwpx: list[tuple[str, str, str]], monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """변환 함수의 시그니처가 다르면 None (CLI로 대체)."""
+        module = sys.modules["pypandoc_hwpx.PandocToHwpx"]
+        monkeypatch.setattr(
+            module, "PandocToHwpx", types.SimpleNamespace(convert_to_hwpx=lambda input_path: None)
+        )
+
+        assert _load_in_process_converter() is None
+
+    def test_real_package(self) -> None:
+        """설치된 pypandoc_hwpx가 이 모듈이 호출하는 형태와 일치."""
+        pytest.importorskip("pypandoc_hwpx.PandocToHwpx")
+
+        converter = _load_in_process_converter()
+
+        assert converter is not None
+        convert, reference_doc = converter
+        inspect.signature(convert).bind("input.md", "output.hwpx", reference_doc)
+        assert Path(reference_doc).is_file()